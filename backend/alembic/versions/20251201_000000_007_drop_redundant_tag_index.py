@@ -0,0 +1,30 @@
+"""drop redundant tags user_id index
+
+Revision ID: 007
+Revises: 006
+Create Date: 2025-12-01 00:00:00.000000
+
+The unique constraint uq_tags_user_name on (user_id, name) already serves
+user_id lookups through its leftmost column, so the single-column index only
+adds write cost.
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "007"
+down_revision: Union[str, None] = "006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index("ix_tags_user_id", table_name="tags")
+
+
+def downgrade() -> None:
+    op.create_index("ix_tags_user_id", "tags", ["user_id"], unique=False)
@@ -0,0 +1,74 @@
+"""transaction type enum and partial expense index
+
+Revision ID: 008
+Revises: 007
+Create Date: 2025-12-01 00:00:01.000000
+
+On PostgreSQL, transactions.type becomes a native transaction_type ENUM and
+replaces the check_transaction_type CHECK constraint. SQLite has no enum
+type, so the column and its CHECK constraint are left as they are there.
+
+Both dialects get a partial index on (user_id, date) for expense rows.
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "008"
+down_revision: Union[str, None] = "007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+transaction_type = postgresql.ENUM("income", "expense", name="transaction_type")
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        transaction_type.create(bind, checkfirst=True)
+        op.drop_constraint("check_transaction_type", "transactions", type_="check")
+        op.alter_column(
+            "transactions",
+            "type",
+            existing_type=sa.String(length=10),
+            type_=transaction_type,
+            existing_nullable=False,
+            postgresql_using="type::transaction_type",
+        )
+
+    op.create_index(
+        "ix_tx_user_date_expense",
+        "transactions",
+        ["user_id", "date"],
+        unique=False,
+        postgresql_where=sa.text("type = 'expense'"),
+        sqlite_where=sa.text("type = 'expense'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_tx_user_date_expense", table_name="transactions")
+
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        op.alter_column(
+            "transactions",
+            "type",
+            existing_type=transaction_type,
+            type_=sa.String(length=10),
+            existing_nullable=False,
+            postgresql_using="type::text",
+        )
+        op.create_check_constraint(
+            "check_transaction_type",
+            "transactions",
+            "type IN ('income', 'expense')",
+        )
+        transaction_type.drop(bind, checkfirst=True)
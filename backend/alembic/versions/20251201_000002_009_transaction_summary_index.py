@@ -0,0 +1,34 @@
+"""transaction summary index
+
+Revision ID: 009
+Revises: 008
+Create Date: 2025-12-01 00:00:02.000000
+
+Composite index backing the dashboard income/expense sums, which filter on
+user, type and hide_from_summary over a date range.
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "009"
+down_revision: Union[str, None] = "008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_transactions_summary",
+        "transactions",
+        ["user_id", "type", "hide_from_summary", "date"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_transactions_summary", table_name="transactions")
@@ -0,0 +1,92 @@
+"""monthly summaries roll-up table
+
+Revision ID: 010
+Revises: 009
+Create Date: 2025-12-01 00:00:03.000000
+
+Creates monthly_summaries, holding per-user income/expense totals per month
+for the dashboard chart, and backfills it from existing transactions.
+
+"""
+
+import uuid
+from datetime import date
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "010"
+down_revision: Union[str, None] = "009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    monthly_summaries = op.create_table(
+        "monthly_summaries",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("user_id", sa.String(length=255), nullable=False),
+        sa.Column("month", sa.Date(), nullable=False),
+        sa.Column("type", sa.String(length=10), nullable=False),
+        sa.Column(
+            "total",
+            sa.Numeric(precision=15, scale=2),
+            nullable=False,
+            server_default="0",
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "user_id", "month", "type", name="uq_monthly_summary_user_month_type"
+        ),
+    )
+
+    # Backfill from existing transactions (hidden transfers excluded)
+    transactions = sa.table(
+        "transactions",
+        sa.column("user_id", sa.String),
+        sa.column("date", sa.DateTime),
+        sa.column("type", sa.String),
+        sa.column("amount", sa.Numeric),
+        sa.column("hide_from_summary", sa.Boolean),
+    )
+    year = sa.extract("year", transactions.c.date)
+    month = sa.extract("month", transactions.c.date)
+    rows = op.get_bind().execute(
+        sa.select(
+            transactions.c.user_id,
+            year,
+            month,
+            transactions.c.type,
+            sa.func.sum(transactions.c.amount),
+        )
+        .where(transactions.c.hide_from_summary == sa.false())
+        .group_by(transactions.c.user_id, year, month, transactions.c.type)
+    ).all()
+
+    if rows:
+        op.bulk_insert(
+            monthly_summaries,
+            [
+                {
+                    "id": uuid.uuid4(),
+                    "user_id": user_id,
+                    "month": date(int(y), int(m), 1),
+                    "type": str(tx_type),
+                    "total": total,
+                }
+                for user_id, y, m, tx_type, total in rows
+            ],
+        )
+
+
+def downgrade() -> None:
+    op.drop_table("monthly_summaries")
@@ -0,0 +1,93 @@
+"""transaction display snapshots
+
+Revision ID: 011
+Revises: 010
+Create Date: 2025-12-01 00:00:04.000000
+
+Adds denormalized category name/color/icon and account name columns to
+transactions so list endpoints can skip the category/account joins, and
+backfills them from the current categories and accounts.
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "011"
+down_revision: Union[str, None] = "010"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "transactions",
+        sa.Column("category_name_snapshot", sa.String(length=100), nullable=True),
+    )
+    op.add_column(
+        "transactions",
+        sa.Column("category_color_snapshot", sa.String(length=7), nullable=True),
+    )
+    op.add_column(
+        "transactions",
+        sa.Column("category_icon_snapshot", sa.String(length=50), nullable=True),
+    )
+    op.add_column(
+        "transactions",
+        sa.Column("account_name_snapshot", sa.String(length=100), nullable=True),
+    )
+
+    # Backfill from the current category/account values
+    transactions = sa.table(
+        "transactions",
+        sa.column("category_id", sa.Uuid),
+        sa.column("account_id", sa.Uuid),
+        sa.column("category_name_snapshot", sa.String),
+        sa.column("category_color_snapshot", sa.String),
+        sa.column("category_icon_snapshot", sa.String),
+        sa.column("account_name_snapshot", sa.String),
+    )
+    categories = sa.table(
+        "categories",
+        sa.column("id", sa.Uuid),
+        sa.column("name", sa.String),
+        sa.column("color", sa.String),
+        sa.column("icon", sa.String),
+    )
+    accounts = sa.table(
+        "accounts",
+        sa.column("id", sa.Uuid),
+        sa.column("name", sa.String),
+    )
+
+    def category_value(column):
+        return (
+            sa.select(column)
+            .where(categories.c.id == transactions.c.category_id)
+            .scalar_subquery()
+        )
+
+    op.execute(
+        transactions.update().values(
+            category_name_snapshot=category_value(categories.c.name),
+            category_color_snapshot=category_value(categories.c.color),
+            category_icon_snapshot=category_value(categories.c.icon),
+            account_name_snapshot=(
+                sa.select(accounts.c.name)
+                .where(accounts.c.id == transactions.c.account_id)
+                .scalar_subquery()
+            ),
+        )
+    )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("transactions") as batch_op:
+        batch_op.drop_column("account_name_snapshot")
+        batch_op.drop_column("category_icon_snapshot")
+        batch_op.drop_column("category_color_snapshot")
+        batch_op.drop_column("category_name_snapshot")
@@ -0,0 +1,34 @@
+"""transaction keyset pagination index
+
+Revision ID: 012
+Revises: 011
+Create Date: 2025-12-01 00:00:05.000000
+
+Composite index on (user_id, date, id) so the transaction list can page by
+(date, id) cursor instead of scanning and discarding OFFSET rows.
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "012"
+down_revision: Union[str, None] = "011"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_transactions_user_date_id",
+        "transactions",
+        ["user_id", "date", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_transactions_user_date_id", table_name="transactions")
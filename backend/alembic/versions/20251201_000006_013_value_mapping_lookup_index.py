@@ -0,0 +1,39 @@
+"""import value mapping lookup index
+
+Revision ID: 013
+Revises: 012
+Create Date: 2025-12-01 00:00:06.000000
+
+Composite index on (profile_id, mapping_type, csv_value). Mapping reads
+filter on a profile (and usually a type and a set of CSV values), and the
+profile_id foreign key had no index of its own, so each lookup scanned the
+whole table.
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "013"
+down_revision: Union[str, None] = "012"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_import_value_mappings_profile_type_value",
+        "import_value_mappings",
+        ["profile_id", "mapping_type", "csv_value"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_import_value_mappings_profile_type_value",
+        table_name="import_value_mappings",
+    )
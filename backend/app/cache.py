@@ -0,0 +1,114 @@
+"""
+User-scoped response cache.
+
+Values are JSON-serializable payloads keyed by (namespace, user_id). Caching
+is only enabled when REDIS_URL is configured, so every worker sees the same
+entries and an invalidation reaches all of them; without it every read goes
+to the database. Keys always include the user ID so one user's data can never
+be served to another.
+"""
+
+import json
+import logging
+from typing import Any
+
+from fastapi.encoders import jsonable_encoder
+
+from app.config import settings
+
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "dompy"
+
+
+def _key(namespace: str, user_id: str) -> str:
+    return f"{KEY_PREFIX}:{namespace}:{user_id}"
+
+
+class _NullBackend:
+    """Used when REDIS_URL is not set: every read is a miss."""
+
+    def get(self, key: str) -> str | None:
+        return None
+
+    def set(self, key: str, value: str, ttl: int) -> None:
+        pass
+
+    def delete(self, *keys: str) -> None:
+        pass
+
+
+class _RedisBackend:
+    """
+    Redis-backed cache shared across worker processes.
+
+    Redis errors are logged and treated as a miss, so an unreachable Redis
+    falls back to the database instead of failing the request.
+    """
+
+    def __init__(self, url: str) -> None:
+        try:
+            import redis
+        except ImportError:
+            raise ValueError("REDIS_URL is set but the redis package is not installed.")
+
+        self._client = redis.Redis.from_url(url, decode_responses=True)
+        self._error = redis.RedisError
+
+    def get(self, key: str) -> str | None:
+        try:
+            return self._client.get(key)
+        except self._error as exc:
+            logger.warning("Cache read failed for %s: %s", key, exc)
+            return None
+
+    def set(self, key: str, value: str, ttl: int) -> None:
+        try:
+            self._client.set(key, value, ex=ttl)
+        except self._error as exc:
+            logger.warning("Cache write failed for %s: %s", key, exc)
+
+    def delete(self, *keys: str) -> None:
+        if not keys:
+            return
+        try:
+            self._client.delete(*keys)
+        except self._error as exc:
+            logger.warning("Cache invalidation failed for %s: %s", keys, exc)
+
+
+_backend = _RedisBackend(settings.REDIS_URL) if settings.REDIS_URL else _NullBackend()
+
+
+def get(namespace: str, user_id: str) -> Any | None:
+    """Return the cached payload for a user, or None on a miss."""
+    raw = _backend.get(_key(namespace, user_id))
+    return json.loads(raw) if raw is not None else None
+
+
+def set(namespace: str, user_id: str, value: Any, ttl: int | None = None) -> None:
+    """Cache a payload for a user. Non-JSON types are encoded like responses."""
+    if not settings.REDIS_URL:
+        return  # Caching disabled; skip encoding a payload nobody will read
+    payload = json.dumps(jsonable_encoder(value))
+    _backend.set(
+        _key(namespace, user_id),
+        payload,
+        settings.CACHE_TTL_SECONDS if ttl is None else ttl,
+    )
+
+
+def invalidate(user_id: str, *namespaces: str) -> None:
+    """Drop cached payloads for a user (all dashboard namespaces by default)."""
+    _backend.delete(*(_key(ns, user_id) for ns in namespaces or DASHBOARD_NAMESPACES))
+
+
+# Namespaces derived from transactions, accounts and categories
+DASHBOARD_STATS = "stats"
+DASHBOARD_RECENT = "recent"
+DASHBOARD_NAMESPACES = (DASHBOARD_STATS, DASHBOARD_RECENT)
+
+# Tag list; tags are only created by transaction writes, so it lives longer
+TAGS = "tags"
+TAGS_TTL_SECONDS = 60
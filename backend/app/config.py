@@ -24,9 +24,29 @@ class Settings(BaseSettings):
     # Database - SQLite by default for local dev, set DATABASE_URL env var for PostgreSQL in production
     DATABASE_URL: str = f"sqlite:///{BACKEND_DIR}/neobudget.db"
 
+    # Connection pool (PostgreSQL only) - per worker process
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30  # Seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = 3600  # Seconds before a connection is replaced
+
     # Application
     DEBUG: bool = False
 
+    # Log a warning when a single request executes more queries than this (0 disables)
+    QUERY_COUNT_WARN_THRESHOLD: int = 20
+
+    # Cache - shared Redis when set, otherwise responses are not cached
+    REDIS_URL: str = ""
+    CACHE_TTL_SECONDS: int = 30
+
+    # Import parsing - max files parsed at once, in their own worker threads
+    IMPORT_PARSE_CONCURRENCY: int = 2
+
+    # HMAC key for parsed import rows; random per process when unset, which
+    # only means confirm requests fall back to full validation across workers
+    IMPORT_SIGNING_KEY: str = ""
+
     # CORS - comma separated origins
     CORS_ORIGINS: str = "http://localhost:3000"
 
@@ -2,9 +2,25 @@
 CRUD operations for database entities.
 """
 
-from app.crud import account, category, budget, tag, transaction, import_profile
-
-__all__ = ["account", "category", "budget", "tag", "transaction", "import_profile"]
+from app.crud import (
+    account,
+    category,
+    budget,
+    tag,
+    transaction,
+    import_profile,
+    monthly_summary,
+)
+
+__all__ = [
+    "account",
+    "category",
+    "budget",
+    "tag",
+    "transaction",
+    "import_profile",
+    "monthly_summary",
+]
 
 
 
@@ -5,28 +5,47 @@ CRUD operations for Account entity.
 from uuid import UUID
 from decimal import Decimal
 
-from sqlalchemy import select
+from sqlalchemy import select, bindparam, update
 from sqlalchemy.orm import Session
 
 from app.models.account import Account
+from app.models.transaction import Transaction
 from app.schemas.account import AccountCreate, AccountUpdate
 
 
+# Built once at import time instead of on every call
+_GET_ACCOUNTS_STMT = (
+    select(Account)
+    .where(Account.user_id == bindparam("user_id"))
+    .order_by(Account.name)
+)
+
+
 def get_accounts(db: Session, user_id: str) -> list[Account]:
     """Get all accounts for a user ordered by name."""
-    stmt = select(Account).where(Account.user_id == user_id).order_by(Account.name)
-    return list(db.scalars(stmt).all())
+    return list(db.scalars(_GET_ACCOUNTS_STMT, {"user_id": user_id}).all())
 
 
 def get_account(db: Session, account_id: UUID, user_id: str) -> Account | None:
-    """Get a single account by ID, verifying ownership."""
-    stmt = select(Account).where(Account.id == account_id, Account.user_id == user_id)
-    return db.scalars(stmt).first()
+    """
+    Get a single account by ID, verifying ownership.
+
+    A primary-key get checks the session's identity map before querying.
+    """
+    account = db.get(Account, account_id)
+    if account is None or account.user_id != user_id:
+        return None
+    return account
+
+
+def build_account(data: AccountCreate, user_id: str) -> Account:
+    """Build an unsaved account for a user (caller adds and commits)."""
+    return Account(**data.model_dump(), user_id=user_id)
 
 
 def create_account(db: Session, data: AccountCreate, user_id: str) -> Account:
     """Create a new account for a user."""
-    account = Account(**data.model_dump(), user_id=user_id)
+    account = build_account(data, user_id)
     db.add(account)
     db.commit()
     db.refresh(account)
@@ -45,6 +64,17 @@ def update_account(
     for field, value in update_data.items():
         setattr(account, field, value)
 
+    # Keep the denormalized name on transactions in sync (same DB transaction)
+    if "name" in update_data:
+        db.execute(
+            update(Transaction)
+            .where(
+                Transaction.account_id == account_id,
+                Transaction.user_id == user_id,
+            )
+            .values(account_name_snapshot=account.name)
+        )
+
     db.commit()
     db.refresh(account)
     return account
@@ -84,16 +114,19 @@ def delete_account(db: Session, account_id: UUID, user_id: str) -> tuple[bool, i
 
 def update_balance(
     db: Session, account_id: UUID, amount_delta: Decimal, user_id: str
-) -> Account | None:
+) -> bool:
     """
     Update account balance by a delta amount.
     Positive delta increases balance, negative decreases.
-    """
-    account = get_account(db, account_id, user_id)
-    if not account:
-        return None
 
-    account.balance = account.balance + amount_delta
-    db.commit()
-    db.refresh(account)
-    return account
+    Applied as a single atomic UPDATE balance = balance + delta, so it never
+    reads the account first and concurrent writes can't lose an update.
+    Does not commit; the caller commits it with the rest of its changes.
+    Returns False if the account was not found.
+    """
+    result = db.execute(
+        update(Account)
+        .where(Account.id == account_id, Account.user_id == user_id)
+        .values(balance=Account.balance + amount_delta)
+    )
+    return result.rowcount > 0
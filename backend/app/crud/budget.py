@@ -6,7 +6,7 @@ from datetime import date
 from decimal import Decimal
 from uuid import UUID
 
-from sqlalchemy import select, func, extract
+from sqlalchemy import select, func, extract, bindparam, update
 from sqlalchemy.orm import Session
 
 from app.models.budget import Budget
@@ -14,6 +14,22 @@ from app.models.transaction import Transaction
 from app.schemas.budget import BudgetCreate, BudgetUpdate
 
 
+# Built once at import time so each lookup skips constructing the select
+_GET_BUDGETS_STMT = (
+    select(Budget)
+    .where(Budget.user_id == bindparam("user_id"))
+    .order_by(Budget.month.desc())
+)
+_GET_BUDGET_STMT = select(Budget).where(
+    Budget.id == bindparam("budget_id"), Budget.user_id == bindparam("user_id")
+)
+_GET_BUDGET_BY_CATEGORY_MONTH_STMT = select(Budget).where(
+    Budget.user_id == bindparam("user_id"),
+    Budget.category_id == bindparam("category_id"),
+    Budget.month == bindparam("month"),
+)
+
+
 def parse_month(month_str: str) -> date:
     """Convert YYYY-MM string to first day of month date."""
     year, month = month_str.split("-")
@@ -25,19 +41,19 @@ def get_budgets(db: Session, user_id: str, month: str | None = None) -> list[Bud
     Get all budgets for a user, optionally filtered by month.
     Includes spent calculation and category info.
     """
-    stmt = select(Budget).where(Budget.user_id == user_id).order_by(Budget.month.desc())
+    stmt = _GET_BUDGETS_STMT
 
     if month:
         month_date = parse_month(month)
         stmt = stmt.where(Budget.month == month_date)
 
-    return list(db.scalars(stmt).all())
+    return list(db.scalars(stmt, {"user_id": user_id}).all())
 
 
 def get_budget(db: Session, budget_id: UUID, user_id: str) -> Budget | None:
     """Get a single budget by ID, verifying ownership."""
-    stmt = select(Budget).where(Budget.id == budget_id, Budget.user_id == user_id)
-    return db.scalars(stmt).first()
+    params = {"budget_id": budget_id, "user_id": user_id}
+    return db.scalars(_GET_BUDGET_STMT, params).first()
 
 
 def get_budget_by_category_month(
@@ -47,12 +63,8 @@ def get_budget_by_category_month(
     user_id: str,
 ) -> Budget | None:
     """Get budget for a specific category and month for a user."""
-    stmt = select(Budget).where(
-        Budget.user_id == user_id,
-        Budget.category_id == category_id,
-        Budget.month == month,
-    )
-    return db.scalars(stmt).first()
+    params = {"user_id": user_id, "category_id": category_id, "month": month}
+    return db.scalars(_GET_BUDGET_BY_CATEGORY_MONTH_STMT, params).first()
 
 
 def create_budget(db: Session, data: BudgetCreate, user_id: str) -> Budget:
@@ -80,6 +92,7 @@ def create_budget(db: Session, data: BudgetCreate, user_id: str) -> Budget:
 
     # Calculate initial spent amount
     recalculate_spent(db, data.category_id, month_date, user_id)
+    db.commit()
     db.refresh(budget)
 
     return budget
@@ -119,6 +132,7 @@ def recalculate_spent(
     Recalculate spent_amount for a budget based on transactions.
     Called when transactions are created/updated/deleted.
     Excludes transactions with hide_from_summary=True (transfers).
+    Does not commit; the caller commits it with the rest of its changes.
     """
     budget = get_budget_by_category_month(db, category_id, month, user_id)
     if not budget:
@@ -136,5 +150,26 @@ def recalculate_spent(
     )
 
     spent = db.scalar(stmt)
-    budget.spent_amount = Decimal(str(spent))
-    db.commit()
+    budget.spent_amount = spent or Decimal("0")
+
+
+def apply_spent_deltas(
+    db: Session, deltas: dict[tuple[UUID, date], Decimal], user_id: str
+) -> None:
+    """
+    Add new expense totals to budgets by (category_id, month).
+
+    Used by bulk inserts of visible expenses instead of recalculating each
+    budget; months without a budget for the category are skipped.
+    Does not commit; the caller commits it with the rest of its changes.
+    """
+    for (category_id, month), delta in deltas.items():
+        db.execute(
+            update(Budget)
+            .where(
+                Budget.user_id == user_id,
+                Budget.category_id == category_id,
+                Budget.month == month,
+            )
+            .values(spent_amount=Budget.spent_amount + delta)
+        )
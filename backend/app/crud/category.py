@@ -2,15 +2,29 @@
 CRUD operations for Category entity.
 """
 
-from uuid import UUID
+from uuid import UUID, uuid4
 
-from sqlalchemy import select
+from sqlalchemy import select, bindparam, update
 from sqlalchemy.orm import Session
 
 from app.models.category import Category
+from app.models.transaction import Transaction
 from app.schemas.category import CategoryCreate, CategoryUpdate
 
 
+# Built once at import time; only the bound parameters change per call
+_GET_CATEGORIES_STMT = (
+    select(Category)
+    .where(Category.user_id == bindparam("user_id"))
+    .order_by(Category.type, Category.name)
+)
+_GET_PARENT_CATEGORIES_STMT = (
+    select(Category)
+    .where(Category.user_id == bindparam("user_id"), Category.parent_id.is_(None))
+    .order_by(Category.type, Category.name)
+)
+
+
 def get_categories(
     db: Session,
     user_id: str,
@@ -20,16 +34,12 @@ def get_categories(
     Get all categories for a user, optionally filtered by type.
     Ordered by type, then name.
     """
-    stmt = (
-        select(Category)
-        .where(Category.user_id == user_id)
-        .order_by(Category.type, Category.name)
-    )
+    stmt = _GET_CATEGORIES_STMT
 
     if category_type:
         stmt = stmt.where(Category.type == category_type)
 
-    return list(db.scalars(stmt).all())
+    return list(db.scalars(stmt, {"user_id": user_id}).all())
 
 
 def get_categories_hierarchical(db: Session, user_id: str) -> dict[str, list[Category]]:
@@ -38,12 +48,7 @@ def get_categories_hierarchical(db: Session, user_id: str) -> dict[str, list[Cat
     Returns dict with 'income' and 'expense' keys, each containing parent categories.
     Children are loaded via relationship.
     """
-    stmt = (
-        select(Category)
-        .where(Category.user_id == user_id, Category.parent_id.is_(None))
-        .order_by(Category.type, Category.name)
-    )
-    parents = list(db.scalars(stmt).all())
+    parents = list(db.scalars(_GET_PARENT_CATEGORIES_STMT, {"user_id": user_id}).all())
 
     return {
         "income": [c for c in parents if c.type == "income"],
@@ -52,17 +57,21 @@ def get_categories_hierarchical(db: Session, user_id: str) -> dict[str, list[Cat
 
 
 def get_category(db: Session, category_id: UUID, user_id: str) -> Category | None:
-    """Get a single category by ID, verifying ownership."""
-    stmt = select(Category).where(
-        Category.id == category_id, Category.user_id == user_id
-    )
-    return db.scalars(stmt).first()
+    """
+    Get a single category by ID, verifying ownership.
+
+    A primary-key get checks the session's identity map before querying.
+    """
+    category = db.get(Category, category_id)
+    if category is None or category.user_id != user_id:
+        return None
+    return category
 
 
-def create_category(db: Session, data: CategoryCreate, user_id: str) -> Category:
+def build_category(db: Session, data: CategoryCreate, user_id: str) -> Category:
     """
-    Create a new category for a user.
-    Validates 2-level hierarchy constraint.
+    Build an unsaved category for a user (caller adds and commits).
+    Validates 2-level hierarchy constraint; only reads when a parent is given.
     """
     # Validate parent if provided
     if data.parent_id:
@@ -74,7 +83,15 @@ def create_category(db: Session, data: CategoryCreate, user_id: str) -> Category
         if parent.type != data.type:
             raise ValueError("Child category must have the same type as parent")
 
-    category = Category(**data.model_dump(), user_id=user_id)
+    return Category(**data.model_dump(), user_id=user_id)
+
+
+def create_category(db: Session, data: CategoryCreate, user_id: str) -> Category:
+    """
+    Create a new category for a user.
+    Validates 2-level hierarchy constraint.
+    """
+    category = build_category(db, data, user_id)
     db.add(category)
     db.commit()
     db.refresh(category)
@@ -107,6 +124,21 @@ def update_category(
     for field, value in update_data.items():
         setattr(category, field, value)
 
+    # Keep the denormalized display values on transactions in sync
+    if update_data.keys() & {"name", "color", "icon"}:
+        db.execute(
+            update(Transaction)
+            .where(
+                Transaction.category_id == category_id,
+                Transaction.user_id == user_id,
+            )
+            .values(
+                category_name_snapshot=category.name,
+                category_color_snapshot=category.color,
+                category_icon_snapshot=category.icon,
+            )
+        )
+
     db.commit()
     db.refresh(category)
     return category
@@ -194,11 +226,15 @@ def ensure_transfer_categories(db: Session, user_id: str) -> dict[str, UUID]:
     - "Outgoing transfer" (type: expense, is_system: true)
 
     Returns dict with category IDs: {"incoming", "outgoing"}
+
+    New categories get their id client-side, so it is known without a flush;
+    both are written by the final commit.
     """
     # Check/create Incoming transfer (root-level, is_system=True)
     incoming = get_category_by_name(db, "Incoming transfer", user_id)
     if not incoming:
         incoming = Category(
+            id=uuid4(),
             user_id=user_id,
             name="Incoming transfer",
             type="income",
@@ -207,12 +243,12 @@ def ensure_transfer_categories(db: Session, user_id: str) -> dict[str, UUID]:
             is_system=True,
         )
         db.add(incoming)
-        db.flush()
 
     # Check/create Outgoing transfer (root-level, is_system=True)
     outgoing = get_category_by_name(db, "Outgoing transfer", user_id)
     if not outgoing:
         outgoing = Category(
+            id=uuid4(),
             user_id=user_id,
             name="Outgoing transfer",
             type="expense",
@@ -221,7 +257,6 @@ def ensure_transfer_categories(db: Session, user_id: str) -> dict[str, UUID]:
             is_system=True,
         )
         db.add(outgoing)
-        db.flush()
 
     db.commit()
 
@@ -7,6 +7,7 @@ from uuid import UUID
 from sqlalchemy import select
 from sqlalchemy.orm import Session, joinedload
 
+from app.database import no_expire_on_commit
 from app.models.import_profile import ImportProfile, ImportValueMapping
 from app.schemas.import_profile import (
     ImportProfileCreate,
@@ -135,6 +136,25 @@ def get_value_mappings_dict(
     return {m.csv_value: m.internal_id for m in mappings}
 
 
+def get_value_mappings_by_type(
+    db: Session, profile_id: UUID
+) -> dict[str, dict[str, UUID]]:
+    """
+    Get every value mapping for a profile in one query, grouped by type:
+    mapping_type -> {csv_value -> internal_id}.
+    """
+    stmt = select(
+        ImportValueMapping.mapping_type,
+        ImportValueMapping.csv_value,
+        ImportValueMapping.internal_id,
+    ).where(ImportValueMapping.profile_id == profile_id)
+
+    result: dict[str, dict[str, UUID]] = {"category": {}, "account": {}}
+    for mapping_type, csv_value, internal_id in db.execute(stmt):
+        result.setdefault(mapping_type, {})[csv_value] = internal_id
+    return result
+
+
 def create_value_mapping(
     db: Session, profile_id: UUID, mapping_type: str, csv_value: str, internal_id: UUID
 ) -> ImportValueMapping:
@@ -158,10 +178,17 @@ def create_value_mappings_batch(
     Create multiple value mappings in a batch.
     Skips duplicates (same profile_id, mapping_type, csv_value).
     """
+    # Fetch every mapping this batch touches in one query, not one per item
+    stmt = select(ImportValueMapping).where(
+        ImportValueMapping.profile_id == profile_id,
+        ImportValueMapping.mapping_type == mapping_type,
+        ImportValueMapping.csv_value.in_({item.csv_value for item in mappings}),
+    )
+    by_value = {m.csv_value: m for m in db.scalars(stmt)}
+
     created = []
     for item in mappings:
-        # Check if mapping already exists
-        existing = get_value_mapping(db, profile_id, mapping_type, item.csv_value)
+        existing = by_value.get(item.csv_value)
         if existing:
             # Update existing mapping
             existing.internal_id = item.internal_id
@@ -175,11 +202,12 @@ def create_value_mappings_batch(
                 internal_id=item.internal_id,
             )
             db.add(mapping)
+            by_value[item.csv_value] = mapping
             created.append(mapping)
 
-    db.commit()
-    for m in created:
-        db.refresh(m)
+    # id and created_at are generated client-side, so nothing needs reloading
+    with no_expire_on_commit(db):
+        db.commit()
     return created
 
 
@@ -0,0 +1,110 @@
+"""
+CRUD operations for MonthlySummary roll-ups.
+"""
+
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+from sqlalchemy import select, func, extract, bindparam
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app.models.monthly_summary import MonthlySummary
+from app.models.transaction import Transaction
+
+
+# Built once at import time; the dashboard reads this on every /stats miss
+_GET_SUMMARIES_STMT = select(MonthlySummary).where(
+    MonthlySummary.user_id == bindparam("user_id"),
+    MonthlySummary.month >= bindparam("since"),
+)
+
+
+def month_of(value: datetime | date) -> date:
+    """Return the first day of the month containing the given date."""
+    return date(value.year, value.month, 1)
+
+
+def get_summaries(db: Session, user_id: str, since: date) -> list[MonthlySummary]:
+    """Get roll-up rows for a user from the given month onwards."""
+    return list(
+        db.scalars(_GET_SUMMARIES_STMT, {"user_id": user_id, "since": since}).all()
+    )
+
+
+def recalculate_month(db: Session, month: date, user_id: str) -> None:
+    """
+    Recalculate income and expense totals for a user's month.
+    Called when transactions are created/updated/deleted.
+    Excludes transactions with hide_from_summary=True (transfers).
+
+    Does not commit; pending transaction changes must already be flushed.
+    """
+    totals_stmt = (
+        select(Transaction.type, func.sum(Transaction.amount))
+        .where(
+            Transaction.user_id == user_id,
+            Transaction.hide_from_summary == False,
+            extract("year", Transaction.date) == month.year,
+            extract("month", Transaction.date) == month.month,
+        )
+        .group_by(Transaction.type)
+    )
+    totals = {tx_type: total for tx_type, total in db.execute(totals_stmt).all()}
+
+    existing_stmt = select(MonthlySummary).where(
+        MonthlySummary.user_id == user_id,
+        MonthlySummary.month == month,
+    )
+    existing = {s.type: s for s in db.scalars(existing_stmt).all()}
+
+    for tx_type in ("income", "expense"):
+        total = totals.get(tx_type) or Decimal("0")
+        summary = existing.get(tx_type)
+        if summary is not None:
+            summary.total = total
+        elif total:
+            db.add(
+                MonthlySummary(
+                    user_id=user_id, month=month, type=tx_type, total=total
+                )
+            )
+
+
+def recalculate_months(db: Session, months: set[date], user_id: str) -> None:
+    """Recalculate every month in the given set for a user."""
+    for month in months:
+        recalculate_month(db, month, user_id)
+
+
+def apply_deltas(
+    db: Session, deltas: dict[tuple[date, str], Decimal], user_id: str
+) -> None:
+    """
+    Adjust roll-up totals in place by (month, type) deltas.
+
+    Used by single-transaction writes instead of recalculate_month, so the
+    cost doesn't grow with the month's history. Each row is a single upsert
+    (INSERT ... ON CONFLICT DO UPDATE SET total = total + delta), so two first
+    writes for the same month can't both try to insert it.
+    Zero deltas are skipped. Does not commit.
+    """
+    dialect_insert = (
+        sqlite_insert if db.get_bind().dialect.name == "sqlite" else pg_insert
+    )
+    for (month, tx_type), delta in deltas.items():
+        if not delta:
+            continue
+        stmt = dialect_insert(MonthlySummary).values(
+            user_id=user_id, month=month, type=tx_type, total=delta
+        )
+        db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["user_id", "month", "type"],
+                set_={
+                    "total": MonthlySummary.total + stmt.excluded.total,
+                    "updated_at": datetime.now(timezone.utc),
+                },
+            )
+        )
@@ -2,22 +2,34 @@
 CRUD operations for Tag entity.
 """
 
-from sqlalchemy import select
+from sqlalchemy import select, bindparam
 from sqlalchemy.orm import Session
 
 from app.models.tag import Tag
 
 
+# Built once at import time so each tag lookup skips constructing the select
+_GET_TAGS_STMT = (
+    select(Tag).where(Tag.user_id == bindparam("user_id")).order_by(Tag.name)
+)
+_GET_TAG_BY_NAME_STMT = select(Tag).where(
+    Tag.user_id == bindparam("user_id"), Tag.name == bindparam("name")
+)
+_GET_TAGS_BY_NAMES_STMT = select(Tag).where(
+    Tag.user_id == bindparam("user_id"),
+    Tag.name.in_(bindparam("names", expanding=True)),
+)
+
+
 def get_tags(db: Session, user_id: str) -> list[Tag]:
     """Get all tags for a user ordered by name."""
-    stmt = select(Tag).where(Tag.user_id == user_id).order_by(Tag.name)
-    return list(db.scalars(stmt).all())
+    return list(db.scalars(_GET_TAGS_STMT, {"user_id": user_id}).all())
 
 
 def get_tag_by_name(db: Session, name: str, user_id: str) -> Tag | None:
     """Get a tag by its name for a specific user."""
-    stmt = select(Tag).where(Tag.user_id == user_id, Tag.name == name.lower().strip())
-    return db.scalars(stmt).first()
+    params = {"user_id": user_id, "name": name.lower().strip()}
+    return db.scalars(_GET_TAG_BY_NAME_STMT, params).first()
 
 
 def get_or_create_tags(db: Session, tag_names: list[str], user_id: str) -> list[Tag]:
@@ -25,21 +37,21 @@ def get_or_create_tags(db: Session, tag_names: list[str], user_id: str) -> list[
     Get existing tags or create new ones for a user.
     Tag names are normalized to lowercase and trimmed.
     """
-    if not tag_names:
+    # Normalize and drop blanks and repeats, keeping the given order
+    names = list(
+        dict.fromkeys(n for n in (name.lower().strip() for name in tag_names) if n)
+    )
+    if not names:
         return []
 
-    tags = []
-    for name in tag_names:
-        normalized = name.lower().strip()
-        if not normalized:
-            continue
-
-        tag = get_tag_by_name(db, normalized, user_id)
-        if not tag:
-            tag = Tag(name=normalized, user_id=user_id)
-            db.add(tag)
-            db.flush()  # Get ID without committing
+    # One query for the existing tags and one flush for all new ones
+    params = {"user_id": user_id, "names": names}
+    tags_by_name = {t.name: t for t in db.scalars(_GET_TAGS_BY_NAMES_STMT, params)}
 
-        tags.append(tag)
+    new_tags = [Tag(name=n, user_id=user_id) for n in names if n not in tags_by_name]
+    if new_tags:
+        db.add_all(new_tags)
+        db.flush()  # Get IDs without committing
+        tags_by_name.update((t.name, t) for t in new_tags)
 
-    return tags
+    return [tags_by_name[n] for n in names]
@@ -2,15 +2,20 @@
 CRUD operations for Transaction entity.
 """
 
+import base64
 import uuid as uuid_module
-from datetime import date
+from collections import defaultdict
+from datetime import date, datetime
 from decimal import Decimal
 from uuid import UUID
 
-from sqlalchemy import select, or_, extract, func, delete
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import select, or_, extract, func, delete, insert, tuple_
+from sqlalchemy.orm import Session, with_expression
 
-from app.models.transaction import Transaction
+from app.models.account import Account
+from app.models.category import Category
+from app.models.tag import Tag, transaction_tags
+from app.models.transaction import Transaction, TAG_NAME_SEPARATOR
 from app.schemas.transaction import (
     TransactionCreate,
     TransactionUpdate,
@@ -21,27 +26,47 @@ from app.crud import tag as tag_crud
 from app.crud import account as account_crud
 from app.crud import budget as budget_crud
 from app.crud import category as category_crud
+from app.crud import monthly_summary as summary_crud
 
 
-def get_transactions(
-    db: Session, filters: TransactionFilter, user_id: str
-) -> list[Transaction]:
+# Tag names aggregated per transaction in a correlated subquery, so read paths
+# get a single string column instead of materializing Tag rows via a join
+_TAG_NAMES_EXPR = func.coalesce(
+    select(func.aggregate_strings(Tag.name, TAG_NAME_SEPARATOR))
+    .select_from(transaction_tags.join(Tag, Tag.id == transaction_tags.c.tag_id))
+    .where(transaction_tags.c.transaction_id == Transaction.id)
+    .scalar_subquery(),
+    "",
+)
+
+
+def _with_related(stmt):
     """
-    Get transactions for a user with filters and pagination.
-    Includes related category, account, and tags.
+    Attach aggregated tag names to a select.
+
+    Everything the response needs arrives in the single SELECT without joins:
+    category/account display values are snapshot columns on the row and tags
+    come from the aggregated tag_names expression.
     """
-    stmt = (
-        select(Transaction)
-        .where(Transaction.user_id == user_id)
-        .options(
-            joinedload(Transaction.category),
-            joinedload(Transaction.account),
-            joinedload(Transaction.tags),
-        )
-        .order_by(Transaction.date.desc())
-    )
+    return stmt.options(
+        with_expression(Transaction.tag_names, _TAG_NAMES_EXPR),
+    ).execution_options(populate_existing=True)
+
+
+def _snapshot_values(db: Session, category_id: UUID, account_id: UUID) -> dict:
+    """Denormalized category/account display values for a transaction row."""
+    category = db.get(Category, category_id)
+    account = db.get(Account, account_id)
+    return {
+        "category_name_snapshot": category.name if category else None,
+        "category_color_snapshot": category.color if category else None,
+        "category_icon_snapshot": category.icon if category else None,
+        "account_name_snapshot": account.name if account else None,
+    }
+
 
-    # Apply filters
+def _apply_filters(stmt, filters: TransactionFilter):
+    """Apply the list filters (search, type, category, account, month) to a select."""
     if filters.search:
         stmt = stmt.where(Transaction.description.ilike(f"%{filters.search}%"))
 
@@ -61,44 +86,138 @@ def get_transactions(
             extract("month", Transaction.date) == int(month),
         )
 
-    # Pagination
-    stmt = stmt.offset(filters.skip).limit(filters.limit)
+    return stmt
+
+
+def encode_cursor(transaction: Transaction) -> str:
+    """Encode a transaction's (date, id) sort key as an opaque page cursor."""
+    raw = f"{transaction.date.isoformat()}|{transaction.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """Decode a page cursor. Raises ValueError if it is malformed."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        date_part, id_part = raw.split("|")
+        return datetime.fromisoformat(date_part), UUID(id_part)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError("Invalid pagination cursor") from e
+
+
+def _paginate(stmt, filters: TransactionFilter):
+    """
+    Order newest first and apply the page window.
+
+    With a cursor this is keyset pagination: rows strictly after the cursor's
+    (date, id) in sort order, which reads only `limit` index entries however
+    deep the page is. Without one, the deprecated skip offset is used.
+    """
+    stmt = stmt.order_by(Transaction.date.desc(), Transaction.id.desc())
+
+    if filters.cursor:
+        cursor_date, cursor_id = decode_cursor(filters.cursor)
+        stmt = stmt.where(
+            tuple_(Transaction.date, Transaction.id) < tuple_(cursor_date, cursor_id)
+        )
+    else:
+        stmt = stmt.offset(filters.skip)
+
+    return stmt.limit(filters.limit)
+
+
+def get_transactions(
+    db: Session, filters: TransactionFilter, user_id: str
+) -> list[Transaction]:
+    """
+    Get transactions for a user with filters and pagination.
+    Includes related category, account, and tags.
+    """
+    stmt = _with_related(select(Transaction).where(Transaction.user_id == user_id))
+    stmt = _paginate(_apply_filters(stmt, filters), filters)
+
+    return list(db.scalars(stmt).all())
 
-    return list(db.scalars(stmt).unique().all())
+
+def _count_matching(db: Session, filters: TransactionFilter, user_id: str) -> int:
+    """Count all of a user's transactions matching the filters, ignoring paging."""
+    count_stmt = select(func.count(Transaction.id)).where(
+        Transaction.user_id == user_id
+    )
+    return db.scalar(_apply_filters(count_stmt, filters)) or 0
+
+
+def get_transactions_page(
+    db: Session, filters: TransactionFilter, user_id: str
+) -> tuple[list[Transaction], int]:
+    """
+    Get a page of transactions plus the total number of matching rows.
+
+    Without a cursor the total comes from COUNT(*) OVER() in the same query
+    as the page, so the filter is evaluated once; only an empty page (no
+    matches, or skip past the end) needs a separate count. With a cursor the
+    window would only see rows after it, so the total is a separate
+    filter-only count.
+    """
+    if filters.cursor:
+        return (
+            get_transactions(db, filters, user_id),
+            _count_matching(db, filters, user_id),
+        )
+
+    stmt = _with_related(
+        select(Transaction, func.count().over().label("total_count")).where(
+            Transaction.user_id == user_id
+        )
+    )
+    stmt = _paginate(_apply_filters(stmt, filters), filters)
+
+    rows = db.execute(stmt).all()
+    if rows:
+        return [row[0] for row in rows], rows[0].total_count
+
+    return [], _count_matching(db, filters, user_id)
 
 
 def get_transaction(
     db: Session, transaction_id: UUID, user_id: str
 ) -> Transaction | None:
     """Get a single transaction by ID with related data, verifying ownership."""
-    stmt = (
-        select(Transaction)
-        .where(Transaction.id == transaction_id, Transaction.user_id == user_id)
-        .options(
-            joinedload(Transaction.category),
-            joinedload(Transaction.account),
-            joinedload(Transaction.tags),
+    stmt = _with_related(
+        select(Transaction).where(
+            Transaction.id == transaction_id, Transaction.user_id == user_id
         )
     )
     return db.scalars(stmt).first()
 
 
+def get_transaction_meta(
+    db: Session, transaction_id: UUID, user_id: str
+) -> tuple[bool, str] | None:
+    """
+    Get (is_transfer, type) for a transaction, verifying ownership.
+
+    A two-column lookup for routes that only need to pick a write path,
+    without loading the row and its tags.
+    """
+    stmt = select(Transaction.is_transfer, Transaction.type).where(
+        Transaction.id == transaction_id, Transaction.user_id == user_id
+    )
+    row = db.execute(stmt).first()
+    return tuple(row) if row else None
+
+
 def get_recent_transactions(
     db: Session, user_id: str, limit: int = 5
 ) -> list[Transaction]:
     """Get the most recent transactions for a user."""
-    stmt = (
+    stmt = _with_related(
         select(Transaction)
         .where(Transaction.user_id == user_id)
-        .options(
-            joinedload(Transaction.category),
-            joinedload(Transaction.account),
-            joinedload(Transaction.tags),
-        )
         .order_by(Transaction.date.desc())
         .limit(limit)
     )
-    return list(db.scalars(stmt).unique().all())
+    return list(db.scalars(stmt).all())
 
 
 def create_transaction(
@@ -121,6 +240,7 @@ def create_transaction(
         account_id=data.account_id,
         description=data.description,
         tags=tags,
+        **_snapshot_values(db, data.category_id, data.account_id),
     )
     db.add(transaction)
     db.flush()
@@ -134,9 +254,74 @@ def create_transaction(
         month_date = date(data.date.year, data.date.month, 1)
         budget_crud.recalculate_spent(db, data.category_id, month_date, user_id)
 
+    # Update monthly roll-up
+    summary_crud.apply_deltas(
+        db, {(summary_crud.month_of(data.date), data.type): data.amount}, user_id
+    )
+
+    transaction_id = transaction.id
     db.commit()
-    db.refresh(transaction)
-    return transaction
+    # Reload with related data in one query (replaces a plain refresh)
+    return get_transaction(db, transaction_id, user_id)
+
+
+def create_transactions_bulk(
+    db: Session, items: list[TransactionCreate], user_id: str
+) -> int:
+    """
+    Create many untagged transactions in one INSERT and one commit.
+
+    Used by file imports. Side effects are aggregated instead of applied per
+    row: one balance update per account, one roll-up delta per (month, type)
+    and one budget delta per expense (category, month), all committed with
+    the rows. Tags on the items are not attached. Returns the number of
+    transactions created.
+    """
+    if not items:
+        return 0
+
+    snapshots: dict[tuple[UUID, UUID], dict] = {}
+    balance_deltas: dict[UUID, Decimal] = defaultdict(Decimal)
+    summary_deltas: dict[tuple[date, str], Decimal] = defaultdict(Decimal)
+    budget_deltas: dict[tuple[UUID, date], Decimal] = defaultdict(Decimal)
+
+    rows = []
+    for data in items:
+        key = (data.category_id, data.account_id)
+        if key not in snapshots:
+            snapshots[key] = _snapshot_values(db, *key)
+
+        rows.append(
+            {
+                "user_id": user_id,
+                "date": data.date,
+                "type": data.type,
+                "amount": data.amount,
+                "category_id": data.category_id,
+                "account_id": data.account_id,
+                "description": data.description,
+                **snapshots[key],
+            }
+        )
+
+        month = summary_crud.month_of(data.date)
+        balance_deltas[data.account_id] += (
+            data.amount if data.type == "income" else -data.amount
+        )
+        summary_deltas[(month, data.type)] += data.amount
+        if data.type == "expense":
+            budget_deltas[(data.category_id, month)] += data.amount
+
+    # executemany; SQLAlchemy batches it as insertmanyvalues where supported
+    db.execute(insert(Transaction), rows)
+
+    for account_id, delta in balance_deltas.items():
+        account_crud.update_balance(db, account_id, delta, user_id)
+    summary_crud.apply_deltas(db, summary_deltas, user_id)
+    budget_crud.apply_spent_deltas(db, budget_deltas, user_id)
+    db.commit()
+
+    return len(rows)
 
 
 def update_transaction(
@@ -159,6 +344,7 @@ def update_transaction(
     old_account_id = transaction.account_id
     old_category_id = transaction.category_id
     old_date = transaction.date
+    old_hidden = transaction.hide_from_summary
 
     # Update fields
     update_data = data.model_dump(exclude_unset=True)
@@ -171,6 +357,14 @@ def update_transaction(
     for field, value in update_data.items():
         setattr(transaction, field, value)
 
+    # Refresh display snapshots when the category or account changes
+    if "category_id" in update_data or "account_id" in update_data:
+        snapshots = _snapshot_values(
+            db, transaction.category_id, transaction.account_id
+        )
+        for field, value in snapshots.items():
+            setattr(transaction, field, value)
+
     db.flush()
 
     # Recalculate account balances
@@ -193,9 +387,18 @@ def update_transaction(
         new_month = date(transaction.date.year, transaction.date.month, 1)
         budget_crud.recalculate_spent(db, transaction.category_id, new_month, user_id)
 
+    # Move the amount between monthly roll-ups (old and new key may match)
+    summary_deltas: dict[tuple[date, str], Decimal] = defaultdict(Decimal)
+    if not old_hidden:
+        summary_deltas[(summary_crud.month_of(old_date), old_type)] -= old_amount
+    if not transaction.hide_from_summary:
+        new_key = (summary_crud.month_of(transaction.date), transaction.type)
+        summary_deltas[new_key] += transaction.amount
+    summary_crud.apply_deltas(db, summary_deltas, user_id)
+
     db.commit()
-    db.refresh(transaction)
-    return transaction
+    # Reload with related data in one query (replaces a plain refresh)
+    return get_transaction(db, transaction_id, user_id)
 
 
 def delete_transaction(db: Session, transaction_id: UUID, user_id: str) -> bool:
@@ -213,6 +416,7 @@ def delete_transaction(db: Session, transaction_id: UUID, user_id: str) -> bool:
     tx_account_id = transaction.account_id
     tx_category_id = transaction.category_id
     tx_date = transaction.date
+    tx_hidden = transaction.hide_from_summary
 
     db.delete(transaction)
     db.flush()
@@ -226,6 +430,12 @@ def delete_transaction(db: Session, transaction_id: UUID, user_id: str) -> bool:
         month_date = date(tx_date.year, tx_date.month, 1)
         budget_crud.recalculate_spent(db, tx_category_id, month_date, user_id)
 
+    # Update monthly roll-up
+    if not tx_hidden:
+        summary_crud.apply_deltas(
+            db, {(summary_crud.month_of(tx_date), tx_type): -tx_amount}, user_id
+        )
+
     db.commit()
     return True
 
@@ -263,19 +473,21 @@ def delete_transactions_by_account(
 
     Returns the count of deleted transactions.
     """
-    # First, get all transactions to collect budget info for expense transactions
-    stmt = select(Transaction).where(
+    # First, get the columns needed to collect budget info for expense transactions
+    stmt = select(Transaction.type, Transaction.category_id, Transaction.date).where(
         Transaction.account_id == account_id,
         Transaction.user_id == user_id,
     )
-    transactions = list(db.scalars(stmt).all())
+    transactions = db.execute(stmt).all()
 
     if not transactions:
         return 0
 
     # Collect unique (category_id, month) pairs for budget recalculation
     affected_budgets: set[tuple[UUID, date]] = set()
+    affected_months: set[date] = set()
     for tx in transactions:
+        affected_months.add(summary_crud.month_of(tx.date))
         if tx.type == "expense":
             month_date = date(tx.date.year, tx.date.month, 1)
             affected_budgets.add((tx.category_id, month_date))
@@ -291,6 +503,8 @@ def delete_transactions_by_account(
     for category_id, month_date in affected_budgets:
         budget_crud.recalculate_spent(db, category_id, month_date, user_id)
 
+    summary_crud.recalculate_months(db, affected_months, user_id)
+
     return len(transactions)
 
 
@@ -316,21 +530,29 @@ def delete_transactions_by_category(
     # Build list of category IDs to delete
     ids_to_delete = category_ids if category_ids else [category_id]
 
-    # Get all transactions for these categories
-    stmt = select(Transaction).where(
+    # Get only the columns needed for balance reversal and budget recalculation
+    stmt = select(
+        Transaction.type,
+        Transaction.amount,
+        Transaction.account_id,
+        Transaction.category_id,
+        Transaction.date,
+    ).where(
         Transaction.category_id.in_(ids_to_delete),
         Transaction.user_id == user_id,
     )
-    transactions = list(db.scalars(stmt).all())
+    transactions = db.execute(stmt).all()
 
     if not transactions:
         return 0
 
     # Collect data for account balance reversal and budget recalculation
     affected_budgets: set[tuple[UUID, date]] = set()
+    affected_months: set[date] = set()
     account_deltas: dict[UUID, Decimal] = {}
 
     for tx in transactions:
+        affected_months.add(summary_crud.month_of(tx.date))
         # Calculate balance reversal (undo the transaction effect)
         delta = tx.amount if tx.type == "income" else -tx.amount
         reversal = -delta  # Reverse the original effect
@@ -359,6 +581,8 @@ def delete_transactions_by_category(
     for cat_id, month_date in affected_budgets:
         budget_crud.recalculate_spent(db, cat_id, month_date, user_id)
 
+    summary_crud.recalculate_months(db, affected_months, user_id)
+
     return len(transactions)
 
 
@@ -399,6 +623,7 @@ def create_transfer(
         transfer_group_id=transfer_group_id,
         hide_from_summary=data.hide_from_summary,
         tags=[],
+        **_snapshot_values(db, transfer_cats["outgoing"], data.from_account_id),
     )
     db.add(outgoing)
 
@@ -415,6 +640,7 @@ def create_transfer(
         transfer_group_id=transfer_group_id,
         hide_from_summary=data.hide_from_summary,
         tags=[],
+        **_snapshot_values(db, transfer_cats["incoming"], data.to_account_id),
     )
     db.add(incoming)
     db.flush()
@@ -425,11 +651,20 @@ def create_transfer(
     # Destination account: add amount
     account_crud.update_balance(db, data.to_account_id, data.amount, user_id)
 
+    # Visible transfers count towards the monthly roll-up
+    if not data.hide_from_summary:
+        summary_crud.recalculate_month(db, summary_crud.month_of(data.date), user_id)
+
     db.commit()
-    db.refresh(outgoing)
-    db.refresh(incoming)
 
-    return (outgoing, incoming)
+    # Reload both legs with related data in one query
+    return _order_legs(get_transfer_pair(db, transfer_group_id, user_id))
+
+
+def _order_legs(legs: list[Transaction]) -> tuple[Transaction, Transaction]:
+    """Return transfer legs as (outgoing, incoming)."""
+    first, second = legs
+    return (first, second) if first.type == "expense" else (second, first)
 
 
 def get_transfer_pair(
@@ -438,19 +673,13 @@ def get_transfer_pair(
     """
     Get both transactions in a transfer pair by transfer_group_id.
     """
-    stmt = (
-        select(Transaction)
-        .where(
+    stmt = _with_related(
+        select(Transaction).where(
             Transaction.transfer_group_id == transfer_group_id,
             Transaction.user_id == user_id,
         )
-        .options(
-            joinedload(Transaction.category),
-            joinedload(Transaction.account),
-            joinedload(Transaction.tags),
-        )
     )
-    return list(db.scalars(stmt).unique().all())
+    return list(db.scalars(stmt).all())
 
 
 def get_paired_transaction(
@@ -462,18 +691,12 @@ def get_paired_transaction(
     if not transaction.is_transfer or not transaction.transfer_group_id:
         return None
 
-    stmt = (
-        select(Transaction)
-        .where(
+    stmt = _with_related(
+        select(Transaction).where(
             Transaction.transfer_group_id == transaction.transfer_group_id,
             Transaction.user_id == user_id,
             Transaction.id != transaction.id,
         )
-        .options(
-            joinedload(Transaction.category),
-            joinedload(Transaction.account),
-            joinedload(Transaction.tags),
-        )
     )
     return db.scalars(stmt).first()
 
@@ -529,16 +752,23 @@ def update_transfer(
             db, incoming.account_id, new_amount - old_amount, user_id
         )
 
+    old_month = summary_crud.month_of(outgoing.date)
+
     # Apply updates to both transactions
     for field, value in update_data.items():
         setattr(outgoing, field, value)
         setattr(incoming, field, value)
 
+    db.flush()
+    summary_crud.recalculate_months(
+        db, {old_month, summary_crud.month_of(outgoing.date)}, user_id
+    )
+
+    transfer_group_id = outgoing.transfer_group_id
     db.commit()
-    db.refresh(outgoing)
-    db.refresh(incoming)
 
-    return (outgoing, incoming)
+    # Reload both legs with related data in one query
+    return _order_legs(get_transfer_pair(db, transfer_group_id, user_id))
 
 
 def delete_transfer(db: Session, transaction_id: UUID, user_id: str) -> bool:
@@ -555,7 +785,10 @@ def delete_transfer(db: Session, transaction_id: UUID, user_id: str) -> bool:
     paired = get_paired_transaction(db, transaction, user_id)
     if not paired:
         # Orphaned transfer leg - just delete it
+        tx_month = summary_crud.month_of(transaction.date)
         db.delete(transaction)
+        db.flush()
+        summary_crud.recalculate_month(db, tx_month, user_id)
         db.commit()
         return True
 
@@ -571,9 +804,17 @@ def delete_transfer(db: Session, transaction_id: UUID, user_id: str) -> bool:
     # Incoming was +amount, so subtract it
     account_crud.update_balance(db, incoming.account_id, -incoming.amount, user_id)
 
+    tx_month = summary_crud.month_of(outgoing.date)
+    hidden = outgoing.hide_from_summary
+
     # Delete both transactions
     db.delete(outgoing)
     db.delete(incoming)
+    db.flush()
+
+    if not hidden:
+        summary_crud.recalculate_month(db, tx_month, user_id)
+
     db.commit()
 
     return True
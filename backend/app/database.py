@@ -2,7 +2,8 @@
 Database configuration and session management.
 """
 
-from collections.abc import Generator
+from collections.abc import Generator, Iterator
+from contextlib import contextmanager
 
 from sqlalchemy import create_engine, event
 from sqlalchemy.orm import DeclarativeBase, sessionmaker, Session
@@ -32,8 +33,10 @@ def _create_engine():
         return create_engine(
             settings.DATABASE_URL,
             pool_pre_ping=True,  # Verify connections before using
-            pool_size=5,
-            max_overflow=10,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            pool_recycle=settings.DB_POOL_RECYCLE,  # Avoid server-side idle drops
         )
 
 
@@ -50,6 +53,22 @@ class Base(DeclarativeBase):
     pass
 
 
+@contextmanager
+def no_expire_on_commit(db: Session) -> Iterator[Session]:
+    """
+    Keep loaded attributes across commits made inside the block.
+
+    For objects whose columns are all set client-side, this avoids a reload
+    per object after commit.
+    """
+    previous = db.expire_on_commit
+    db.expire_on_commit = False
+    try:
+        yield db
+    finally:
+        db.expire_on_commit = previous
+
+
 def get_db() -> Generator[Session, None, None]:
     """
     Dependency that provides a database session.
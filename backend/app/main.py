@@ -10,8 +10,10 @@ A personal finance management API with support for:
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 
 from app.config import settings
+from app.middleware import QueryCountMiddleware
 from app.routers import (
     accounts,
     categories,
@@ -23,9 +25,18 @@ from app.routers import (
     onboarding,
 )
 
+try:
+    import orjson  # noqa: F401
+
+    # Render response bodies with orjson when it is installed
+    DefaultResponse = ORJSONResponse
+except ImportError:
+    DefaultResponse = JSONResponse
+
 
 # Create FastAPI application
 app = FastAPI(
+    default_response_class=DefaultResponse,
     title="NeoBudget API",
     description="Personal finance management API for the NeoBudget application",
     version="1.0.0",
@@ -42,6 +53,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Per-request query counting (X-DB-Queries header in debug mode)
+app.add_middleware(QueryCountMiddleware)
+
 # Include API routers
 app.include_router(
     accounts.router,
@@ -0,0 +1,7 @@
+"""
+ASGI middleware for the NeoBudget API.
+"""
+
+from app.middleware.query_count import QueryCountMiddleware, count_queries
+
+__all__ = ["QueryCountMiddleware", "count_queries"]
@@ -0,0 +1,108 @@
+"""
+Per-request database query counting.
+
+Every statement sent through any SQLAlchemy engine bumps a counter that is
+scoped to the current request via a context variable. The middleware reports
+the total in the ``X-DB-Queries`` response header (debug mode only) and logs
+a warning when a request exceeds ``QUERY_COUNT_WARN_THRESHOLD``, which makes
+N+1 regressions visible during development and in CI.
+"""
+
+import logging
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.config import settings
+
+
+logger = logging.getLogger(__name__)
+
+
+class QueryCounter:
+    """Mutable counter shared between the request task and its worker threads."""
+
+    __slots__ = ("count",)
+
+    def __init__(self) -> None:
+        self.count = 0
+
+
+# Sync route handlers run in a threadpool with a copy of the request context,
+# so the counter must be a mutable object rather than a plain int.
+_current_counter: ContextVar[QueryCounter | None] = ContextVar(
+    "query_counter", default=None
+)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _count_query(conn, cursor, statement, parameters, context, executemany):
+    """Increment the active counter, if any, for each executed statement."""
+    counter = _current_counter.get()
+    if counter is not None:
+        counter.count += 1
+
+
+@contextmanager
+def count_queries() -> Iterator[QueryCounter]:
+    """
+    Count statements executed inside the block.
+
+    Usage:
+        with count_queries() as counter:
+            crud.get_transactions(db, user_id, filters)
+        assert counter.count <= 2
+    """
+    counter = QueryCounter()
+    token = _current_counter.set(counter)
+    try:
+        yield counter
+    finally:
+        _current_counter.reset(token)
+
+
+class QueryCountMiddleware:
+    """Pure ASGI middleware that counts queries issued while handling a request."""
+
+    def __init__(
+        self,
+        app,
+        warn_threshold: int | None = None,
+        expose_header: bool | None = None,
+    ):
+        self.app = app
+        self.warn_threshold = (
+            settings.QUERY_COUNT_WARN_THRESHOLD
+            if warn_threshold is None
+            else warn_threshold
+        )
+        self.expose_header = settings.DEBUG if expose_header is None else expose_header
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with count_queries() as counter:
+
+            async def send_wrapper(message):
+                if message["type"] == "http.response.start" and self.expose_header:
+                    headers = list(message.get("headers", []))
+                    headers.append((b"x-db-queries", str(counter.count).encode()))
+                    message["headers"] = headers
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                if self.warn_threshold and counter.count > self.warn_threshold:
+                    logger.warning(
+                        "%s %s executed %d queries (threshold %d)",
+                        scope.get("method"),
+                        scope.get("path"),
+                        counter.count,
+                        self.warn_threshold,
+                    )
@@ -6,7 +6,7 @@ import uuid
 from datetime import datetime, timezone
 from typing import Optional
 
-from sqlalchemy import String, ForeignKey, CheckConstraint, JSON
+from sqlalchemy import String, ForeignKey, CheckConstraint, Index, JSON
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
@@ -83,6 +83,13 @@ class ImportValueMapping(Base):
             "mapping_type IN ('category', 'account')",
             name="check_mapping_type",
         ),
+        # Every mapping lookup filters by profile, then type, then csv_value
+        Index(
+            "ix_import_value_mappings_profile_type_value",
+            "profile_id",
+            "mapping_type",
+            "csv_value",
+        ),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(
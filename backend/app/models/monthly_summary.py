@@ -0,0 +1,55 @@
+"""
+MonthlySummary model - per-user monthly income/expense roll-ups.
+"""
+
+import uuid
+from datetime import datetime, timezone, date
+from decimal import Decimal
+
+from sqlalchemy import String, Numeric, Date, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class MonthlySummary(Base):
+    """
+    Pre-aggregated transaction totals per user, month and type.
+
+    Maintained by the transaction write paths so the dashboard chart can read
+    a handful of rows instead of re-aggregating the transactions table.
+    Transactions with hide_from_summary=True are excluded.
+
+    Attributes:
+        id: Unique identifier (UUID)
+        user_id: Clerk user ID for multi-user support
+        month: Summary month (stored as first day of month)
+        type: Transaction type (income or expense)
+        total: Sum of transaction amounts for the month and type
+        updated_at: Last recalculation timestamp
+    """
+
+    __tablename__ = "monthly_summaries"
+
+    # The unique constraint also serves user_id lookups via its leftmost column
+    __table_args__ = (
+        UniqueConstraint(
+            "user_id", "month", "type", name="uq_monthly_summary_user_month_type"
+        ),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        primary_key=True,
+        default=uuid.uuid4,
+    )
+    user_id: Mapped[str] = mapped_column(String(255))
+    month: Mapped[date] = mapped_column(Date)  # Stored as YYYY-MM-01
+    type: Mapped[str] = mapped_column(String(10))
+    total: Mapped[Decimal] = mapped_column(Numeric(15, 2), default=Decimal("0"))
+    updated_at: Mapped[datetime] = mapped_column(
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+    )
+
+    def __repr__(self) -> str:
+        return f"<MonthlySummary {self.month} {self.type} {self.total}>"
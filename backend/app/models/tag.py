@@ -48,7 +48,8 @@ class Tag(Base):
         primary_key=True,
         default=uuid.uuid4,
     )
-    user_id: Mapped[str] = mapped_column(String(255), index=True)
+    # No standalone index: uq_tags_user_name (user_id, name) covers user_id lookups
+    user_id: Mapped[str] = mapped_column(String(255))
     name: Mapped[str] = mapped_column(String(50))
     created_at: Mapped[datetime] = mapped_column(
         default=lambda: datetime.now(timezone.utc),
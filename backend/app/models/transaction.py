@@ -2,18 +2,32 @@
 Transaction model - represents income and expense records.
 """
 
+import sys
 import uuid
 from datetime import datetime, timezone
 from decimal import Decimal
 from typing import Optional
 
-from sqlalchemy import String, Numeric, ForeignKey, CheckConstraint, Boolean
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import (
+    String,
+    Numeric,
+    ForeignKey,
+    CheckConstraint,
+    Boolean,
+    Enum,
+    Index,
+    text,
+)
+from sqlalchemy.orm import Mapped, mapped_column, relationship, query_expression
 
 from app.database import Base
 from app.models.tag import transaction_tags
 
 
+# Separator used when tag names are aggregated into a single string column
+TAG_NAME_SEPARATOR = "\x1f"
+
+
 class Transaction(Base):
     """
     Financial transaction (income or expense).
@@ -30,6 +44,10 @@ class Transaction(Base):
         is_transfer: Whether this is part of a transfer pair
         transfer_group_id: Links two transfer legs together
         hide_from_summary: Excludes from income/expense summaries
+        category_name_snapshot: Denormalized category name for list responses
+        category_color_snapshot: Denormalized category color
+        category_icon_snapshot: Denormalized category icon
+        account_name_snapshot: Denormalized account name
         created_at: Creation timestamp
         updated_at: Last update timestamp
 
@@ -37,13 +55,34 @@ class Transaction(Base):
         category: Associated category
         account: Associated account
         tags: List of associated tags
+
+    Query expressions:
+        tag_names: Aggregated tag names, populated by read queries that
+            use ``with_expression`` instead of loading the tags relationship
     """
 
     __tablename__ = "transactions"
 
     __table_args__ = (
-        CheckConstraint("type IN ('income', 'expense')", name="check_transaction_type"),
         CheckConstraint("amount > 0", name="check_transaction_amount_positive"),
+        # Covers the dashboard summary sums filtered by type and a date range
+        Index(
+            "ix_transactions_summary",
+            "user_id",
+            "type",
+            "hide_from_summary",
+            "date",
+        ),
+        # Partial index for the expense-only queries (budgets, dashboard)
+        Index(
+            "ix_tx_user_date_expense",
+            "user_id",
+            "date",
+            postgresql_where=text("type = 'expense'"),
+            sqlite_where=text("type = 'expense'"),
+        ),
+        # Keyset pagination: ORDER BY date DESC, id DESC walks this backwards
+        Index("ix_transactions_user_date_id", "user_id", "date", "id"),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(
@@ -52,7 +91,9 @@ class Transaction(Base):
     )
     user_id: Mapped[str] = mapped_column(String(255), index=True)
     date: Mapped[datetime] = mapped_column()
-    type: Mapped[str] = mapped_column(String(10))
+    type: Mapped[str] = mapped_column(
+        Enum("income", "expense", name="transaction_type")
+    )
     amount: Mapped[Decimal] = mapped_column(Numeric(15, 2))
     category_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("categories.id", ondelete="RESTRICT"),
@@ -66,6 +107,20 @@ class Transaction(Base):
         String(36), nullable=True, index=True
     )
     hide_from_summary: Mapped[bool] = mapped_column(Boolean, default=False)
+    # Display values copied from category/account so list queries need no joins.
+    # Kept in sync by the category and account update paths.
+    category_name_snapshot: Mapped[Optional[str]] = mapped_column(
+        String(100), nullable=True
+    )
+    category_color_snapshot: Mapped[Optional[str]] = mapped_column(
+        String(7), nullable=True
+    )
+    category_icon_snapshot: Mapped[Optional[str]] = mapped_column(
+        String(50), nullable=True
+    )
+    account_name_snapshot: Mapped[Optional[str]] = mapped_column(
+        String(100), nullable=True
+    )
     created_at: Mapped[datetime] = mapped_column(
         default=lambda: datetime.now(timezone.utc),
     )
@@ -82,5 +137,21 @@ class Transaction(Base):
         secondary=transaction_tags,
     )
 
+    # Populated only when the query supplies it via with_expression()
+    tag_names: Mapped[Optional[str]] = query_expression()
+
+    @property
+    def tag_list(self) -> tuple[str, ...]:
+        """
+        Tag names, from the aggregated column when loaded, else the relationship.
+
+        Names are interned so rows on the same page share one string per tag.
+        """
+        if self.tag_names is not None:
+            if not self.tag_names:
+                return ()
+            return tuple(map(sys.intern, self.tag_names.split(TAG_NAME_SEPARATOR)))
+        return tuple(sys.intern(t.name) for t in self.tags)
+
     def __repr__(self) -> str:
         return f"<Transaction {self.type} {self.amount} - {self.description[:20]}>"
@@ -11,6 +11,7 @@ from app.database import get_db
 from app.auth import get_current_user
 from app.schemas.account import AccountCreate, AccountUpdate, AccountResponse
 from app.crud import account as crud
+from app import cache
 
 router = APIRouter()
 
@@ -47,7 +48,9 @@ def create_account(
     user_id: str = Depends(get_current_user),
 ):
     """Create a new account."""
-    return crud.create_account(db, data, user_id)
+    account = crud.create_account(db, data, user_id)
+    cache.invalidate(user_id)
+    return account
 
 
 @router.patch("/{account_id}", response_model=AccountResponse)
@@ -64,6 +67,7 @@ def update_account(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Account not found",
         )
+    cache.invalidate(user_id)
     return account
 
 
@@ -83,3 +87,4 @@ def delete_account(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Account not found",
         )
+    cache.invalidate(user_id)
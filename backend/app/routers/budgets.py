@@ -10,6 +10,7 @@ from sqlalchemy.orm import Session
 from app.database import get_db
 from app.auth import get_current_user
 from app.schemas.budget import BudgetCreate, BudgetUpdate, BudgetResponse
+from app.schemas.common import MONTH_PATTERN
 from app.crud import budget as crud
 
 router = APIRouter()
@@ -36,7 +37,7 @@ def budget_to_response(budget) -> dict:
 @router.get("", response_model=list[BudgetResponse])
 def list_budgets(
     month: str | None = Query(
-        None, pattern=r"^\d{4}-\d{2}$", description="Filter by month (YYYY-MM)"
+        None, pattern=MONTH_PATTERN, description="Filter by month (YYYY-MM)"
     ),
     db: Session = Depends(get_db),
     user_id: str = Depends(get_current_user),
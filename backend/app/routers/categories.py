@@ -16,6 +16,7 @@ from app.schemas.category import (
     CategoryWithChildren,
 )
 from app.crud import category as crud
+from app import cache
 
 router = APIRouter()
 
@@ -127,6 +128,7 @@ def update_category(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Category not found",
             )
+        cache.invalidate(user_id)
         return category
     except ValueError as e:
         raise HTTPException(
@@ -152,3 +154,4 @@ def delete_category(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Category not found",
         )
+    cache.invalidate(user_id)
@@ -2,12 +2,12 @@
 Dashboard API routes.
 """
 
-from datetime import datetime, timezone, timedelta
-from decimal import Decimal
+from collections import defaultdict
+from datetime import date, datetime, timezone, timedelta
 import calendar
 
 from fastapi import APIRouter, Depends
-from sqlalchemy import select, func, extract
+from sqlalchemy import select, func, bindparam
 from sqlalchemy.orm import Session
 
 from app.database import get_db
@@ -17,9 +17,47 @@ from app.schemas.transaction import TransactionResponse
 from app.models.account import Account
 from app.models.transaction import Transaction
 from app.crud import transaction as tx_crud
+from app.crud import monthly_summary as summary_crud
+from app import cache
 
 router = APIRouter()
 
+# Number of months shown in the dashboard chart, including the current one
+CHART_MONTHS = 6
+
+
+def _zero_stats() -> dict[str, float]:
+    """Zero totals for a chart month."""
+    return {"income": 0.0, "expense": 0.0}
+
+
+# Built once at import time with bound parameters; each request only binds
+# user_id and the month range, skipping statement construction.
+#
+# Total balance for user's accounts, fetched alongside the monthly sums
+_BALANCE_SUBQ = (
+    select(func.coalesce(func.sum(Account.balance), 0))
+    .where(Account.user_id == bindparam("user_id"))
+    .scalar_subquery()
+)
+
+# Monthly income and expenses (excluding hidden transfers) in one scan,
+# using aggregate FILTER clauses instead of one query per type
+_SUMMARY_STMT = select(
+    _BALANCE_SUBQ.label("total_balance"),
+    func.coalesce(
+        func.sum(Transaction.amount).filter(Transaction.type == "income"), 0
+    ).label("monthly_income"),
+    func.coalesce(
+        func.sum(Transaction.amount).filter(Transaction.type == "expense"), 0
+    ).label("monthly_expense"),
+).where(
+    Transaction.user_id == bindparam("user_id"),
+    Transaction.hide_from_summary == False,
+    Transaction.date >= bindparam("month_start"),
+    Transaction.date < bindparam("next_month_start"),
+)
+
 
 @router.get("/stats", response_model=DashboardStats)
 def get_stats(
@@ -32,109 +70,65 @@ def get_stats(
     - Monthly income (current month)
     - Monthly expenses (current month)
     - Chart data (last 6 months)
+
+    Cached per user for CACHE_TTL_SECONDS; writes invalidate the entry.
     """
-    # Total balance for user's accounts
-    balance_stmt = select(func.coalesce(func.sum(Account.balance), 0)).where(
-        Account.user_id == user_id
-    )
-    total_balance = db.scalar(balance_stmt)
+    cached = cache.get(cache.DASHBOARD_STATS, user_id)
+    if cached is not None:
+        return cached
 
-    # Current month/year
+    # Current month as a half-open date range so the index on date can be used
     now = datetime.now(timezone.utc)
-    current_month = now.month
-    current_year = now.year
-
-    # Monthly income for user (excluding hidden transfers)
-    income_stmt = select(func.coalesce(func.sum(Transaction.amount), 0)).where(
-        Transaction.user_id == user_id,
-        Transaction.type == "income",
-        Transaction.hide_from_summary == False,
-        extract("month", Transaction.date) == current_month,
-        extract("year", Transaction.date) == current_year,
-    )
-    monthly_income = db.scalar(income_stmt)
-
-    # Monthly expenses for user (excluding hidden transfers)
-    expense_stmt = select(func.coalesce(func.sum(Transaction.amount), 0)).where(
-        Transaction.user_id == user_id,
-        Transaction.type == "expense",
-        Transaction.hide_from_summary == False,
-        extract("month", Transaction.date) == current_month,
-        extract("year", Transaction.date) == current_year,
-    )
-    monthly_expense = db.scalar(expense_stmt)
+    month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    next_month_start = (month_start + timedelta(days=32)).replace(day=1)
+
+    total_balance, monthly_income, monthly_expense = db.execute(
+        _SUMMARY_STMT,
+        {
+            "user_id": user_id,
+            "month_start": month_start,
+            "next_month_start": next_month_start,
+        },
+    ).one()
 
     # --- Chart Data (Last 6 Months) ---
     
-    # Calculate start date: 1st day of 5 months ago
-    # (current month is included, so we go back 5 months to get total 6)
-    start_date = now.replace(day=1)
-    for _ in range(5):
-        start_date = (start_date - timedelta(days=1)).replace(day=1)
-    
-    # Query grouped by year/month and type
-    chart_stmt = (
-        select(
-            extract('year', Transaction.date).label('year'),
-            extract('month', Transaction.date).label('month'),
-            Transaction.type,
-            func.sum(Transaction.amount).label('total')
-        )
-        .where(
-            Transaction.user_id == user_id,
-            Transaction.date >= start_date,
-            Transaction.hide_from_summary == False
-        )
-        .group_by(
-            extract('year', Transaction.date),
-            extract('month', Transaction.date),
-            Transaction.type
-        )
-    )
-    results = db.execute(chart_stmt).all()
-
-    # Map results: (year, month) -> {income, expense}
-    data_map = {}
-    for r in results:
-        key = (int(r.year), int(r.month))
-        if key not in data_map:
-            data_map[key] = {"income": Decimal(0), "expense": Decimal(0)}
-        
-        if r.type == "income":
-            data_map[key]["income"] = Decimal(str(r.total))
-        elif r.type == "expense":
-            data_map[key]["expense"] = Decimal(str(r.total))
-
-    # Build list ensuring all 6 months are present
+    # First day of each of the last 6 months, oldest first (current included)
+    month_index = now.year * 12 + now.month - 1
+    anchors = [
+        date(m // 12, m % 12 + 1, 1)
+        for m in range(month_index - CHART_MONTHS + 1, month_index + 1)
+    ]
+
+    # Read the pre-aggregated monthly roll-ups instead of grouping transactions
+    summaries = summary_crud.get_summaries(db, user_id, anchors[0])
+
+    # Map results: (year, month) -> {income, expense}; roll-up rows only
+    # ever carry "income" or "expense" as their type
+    data_map = defaultdict(_zero_stats)
+    for r in summaries:
+        data_map[(r.month.year, r.month.month)][r.type] = float(r.total)
+
+    # Build list ensuring all 6 months are present (missing months read as zero)
     chart_data = []
-    curr = start_date
-    # Loop until we pass current month
-    # We compare (year, month) to ensure we stop after current month
-    target = (now.year, now.month)
-    
-    while (curr.year, curr.month) <= target:
-        key = (curr.year, curr.month)
-        stats = data_map.get(key, {"income": Decimal(0), "expense": Decimal(0)})
-        
+    for anchor in anchors:
+        totals = data_map[(anchor.year, anchor.month)]
         chart_data.append(
             MonthlyActivity(
-                month=curr.strftime("%b"),
-                income=stats["income"],
-                expense=stats["expense"]
+                month=anchor.strftime("%b"),
+                income=totals["income"],
+                expense=totals["expense"]
             )
         )
-        
-        # Move to next month
-        # Adding 32 days guarantees we are in the next month, then set to day 1
-        next_month = (curr + timedelta(days=32)).replace(day=1)
-        curr = next_month
-
-    return DashboardStats(
-        total_balance=Decimal(str(total_balance)),
-        monthly_income=Decimal(str(monthly_income)),
-        monthly_expense=Decimal(str(monthly_expense)),
+
+    stats = DashboardStats(
+        total_balance=float(total_balance or 0),
+        monthly_income=float(monthly_income or 0),
+        monthly_expense=float(monthly_expense or 0),
         chart_data=chart_data
     )
+    cache.set(cache.DASHBOARD_STATS, user_id, stats)
+    return stats
 
 
 @router.get("/recent", response_model=list[TransactionResponse])
@@ -143,24 +137,12 @@ def get_recent(
     user_id: str = Depends(get_current_user),
 ):
     """Get the 5 most recent transactions for the current user."""
+    cached = cache.get(cache.DASHBOARD_RECENT, user_id)
+    if cached is not None:
+        return cached
+
     transactions = tx_crud.get_recent_transactions(db, user_id, limit=5)
 
-    return [
-        {
-            "id": tx.id,
-            "date": tx.date,
-            "type": tx.type,
-            "amount": tx.amount,
-            "category_id": tx.category_id,
-            "account_id": tx.account_id,
-            "description": tx.description,
-            "created_at": tx.created_at,
-            "updated_at": tx.updated_at,
-            "tags": [t.name for t in tx.tags],
-            "category_name": tx.category.name if tx.category else None,
-            "category_color": tx.category.color if tx.category else None,
-            "category_icon": tx.category.icon if tx.category else None,
-            "account_name": tx.account.name if tx.account else None,
-        }
-        for tx in transactions
-    ]
+    recent = [TransactionResponse.model_validate(tx) for tx in transactions]
+    cache.set(cache.DASHBOARD_RECENT, user_id, recent)
+    return recent
@@ -2,14 +2,28 @@
 Import API routes for transaction file imports.
 """
 
+from typing import BinaryIO, Iterator
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, status
+import anyio
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Response,
+    UploadFile,
+    File,
+    status,
+)
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
+from app.config import settings
 from app.database import get_db
 from app.auth import get_current_user
 from app.schemas.import_profile import (
+    PARSED_ROW_ADAPTER,
+    PREVIEW_ROW_ADAPTER,
     ImportProfileResponse,
     ParseResult,
     ConfirmImportRequest,
@@ -20,10 +34,49 @@ from app.schemas.import_profile import (
 )
 from app.crud import import_profile as crud
 from app.services import import_service
+from app import cache
 
 
 router = APIRouter()
 
+# Parsing runs on its own worker threads, capped separately from FastAPI's
+# threadpool so large uploads queue here instead of starving other routes.
+# Created on first use since a limiter must belong to the running event loop.
+_parse_limiter: anyio.CapacityLimiter | None = None
+
+
+def _get_parse_limiter() -> anyio.CapacityLimiter:
+    global _parse_limiter
+    if _parse_limiter is None:
+        _parse_limiter = anyio.CapacityLimiter(settings.IMPORT_PARSE_CONCURRENCY)
+    return _parse_limiter
+
+
+# Rows serialized per streamed chunk
+_STREAM_BATCH_SIZE = 500
+
+
+def _iter_parse_result_json(result: ParseResult) -> Iterator[bytes]:
+    """
+    Serialize a ParseResult as JSON in chunks.
+
+    The small summary fields are dumped once, then parsed_rows follow in
+    batches, so the full document is never held as one string.
+    """
+    head = result.model_dump_json(exclude={"parsed_rows"}).encode()
+    # Reopen the summary object and append the rows array as its last key
+    yield head[:-1] + b',"parsed_rows":['
+
+    rows = result.parsed_rows
+    for start in range(0, len(rows), _STREAM_BATCH_SIZE):
+        batch = b",".join(
+            PARSED_ROW_ADAPTER.dump_json(row)
+            for row in rows[start : start + _STREAM_BATCH_SIZE]
+        )
+        yield batch if start == 0 else b"," + batch
+
+    yield b"]}"
+
 
 @router.get("/profiles", response_model=list[ImportProfileResponse])
 def list_profiles(
@@ -66,6 +119,31 @@ def delete_profile(
         )
 
 
+def _parse_and_analyze(
+    db: Session, user_id: str, file: BinaryIO, filename: str
+) -> ParseResult:
+    """Parse an upload and analyze its mappings. Blocking; run in a thread."""
+    # Get or create default profile
+    profile = crud.get_or_create_default_profile(db, user_id)
+
+    # Parse file
+    try:
+        parsed_rows = import_service.parse_file(file, filename)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    except OSError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Error reading file: {str(e)}",
+        )
+
+    # Analyze mappings
+    return import_service.analyze_mappings(db, profile.id, parsed_rows)
+
+
 @router.post("/parse", response_model=ParseResult)
 async def parse_file(
     file: UploadFile = File(...),
@@ -77,6 +155,11 @@ async def parse_file(
 
     Returns parsed rows and lists of unmapped category/account values
     that need to be mapped before import can proceed.
+
+    The upload is parsed straight from its spooled temporary file, so large
+    files are never copied into memory in full. Parsing runs on a worker
+    thread bounded by IMPORT_PARSE_CONCURRENCY, so queued imports don't hold
+    threadpool slots needed by short endpoints. The result is streamed.
     """
     if not file.filename:
         raise HTTPException(
@@ -92,43 +175,23 @@ async def parse_file(
             detail="Unsupported file format. Please upload CSV or Excel (.xlsx) file.",
         )
 
-    # Read file content
-    try:
-        content = await file.read()
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Error reading file: {str(e)}",
-        )
-
-    # Get or create default profile
-    profile = crud.get_or_create_default_profile(db, user_id)
-
-    # Parse file
-    try:
-        parsed_rows = import_service.parse_file(content, file.filename)
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e),
-        )
-
-    # Analyze mappings
-    result = import_service.analyze_mappings(db, profile.id, parsed_rows)
-    return result
+    result = await anyio.to_thread.run_sync(
+        _parse_and_analyze,
+        db,
+        user_id,
+        file.file,
+        file.filename,
+        limiter=_get_parse_limiter(),
+    )
+    return StreamingResponse(
+        _iter_parse_result_json(result), media_type="application/json"
+    )
 
 
-@router.post("/preview", response_model=PreviewResult)
-def preview_import(
-    request: PreviewRequest,
-    db: Session = Depends(get_db),
-    user_id: str = Depends(get_current_user),
-):
-    """
-    Generate a preview of the import with resolved values.
-
-    Shows how each row will be imported, validates data, and detects transfer pairs.
-    """
+def _build_preview(
+    db: Session, user_id: str, request: PreviewRequest
+) -> PreviewResult:
+    """Resolve mappings and generate the preview shared by both preview routes."""
     # Verify profile ownership
     profile = crud.get_profile(db, request.profile_id, user_id)
     if not profile:
@@ -137,20 +200,14 @@ def preview_import(
             detail="Import profile not found",
         )
 
-    # Get existing mappings and merge with new ones
-    existing_cat_mappings = crud.get_value_mappings_dict(
-        db, request.profile_id, "category"
-    )
-    existing_acc_mappings = crud.get_value_mappings_dict(
-        db, request.profile_id, "account"
-    )
+    # Get existing mappings and merge with new ones from the request
+    existing_mappings = crud.get_value_mappings_by_type(db, request.profile_id)
 
-    # Merge with new mappings from request
-    category_mappings = dict(existing_cat_mappings)
+    category_mappings = existing_mappings["category"]
     for item in request.category_mappings:
         category_mappings[item.csv_value] = item.internal_id
 
-    account_mappings = dict(existing_acc_mappings)
+    account_mappings = existing_mappings["account"]
     for item in request.account_mappings:
         account_mappings[item.csv_value] = item.internal_id
 
@@ -173,6 +230,50 @@ def preview_import(
     return result
 
 
+def _iter_preview_ndjson(result: PreviewResult) -> Iterator[bytes]:
+    """Yield one JSON line per preview row, then a summary line."""
+    for row in result.rows:
+        yield PREVIEW_ROW_ADAPTER.dump_json(row) + b"\n"
+    yield result.model_dump_json(exclude={"rows"}).encode() + b"\n"
+
+
+@router.post("/preview", response_model=PreviewResult)
+def preview_import(
+    request: PreviewRequest,
+    db: Session = Depends(get_db),
+    user_id: str = Depends(get_current_user),
+):
+    """
+    Generate a preview of the import with resolved values.
+
+    Shows how each row will be imported, validates data, and detects transfer pairs.
+    """
+    result = _build_preview(db, user_id, request)
+
+    # Serialize in one pydantic-core pass; FastAPI would otherwise re-validate
+    # the result against response_model and encode it again
+    return Response(content=result.model_dump_json(), media_type="application/json")
+
+
+@router.post("/preview/stream")
+def preview_import_stream(
+    request: PreviewRequest,
+    db: Session = Depends(get_db),
+    user_id: str = Depends(get_current_user),
+):
+    """
+    Generate an import preview as NDJSON.
+
+    Each line is one preview row in file order. The last line holds the
+    remaining PreviewResult fields (profile_id, totals and warnings), so
+    clients can render rows as they arrive.
+    """
+    result = _build_preview(db, user_id, request)
+    return StreamingResponse(
+        _iter_preview_ndjson(result), media_type="application/x-ndjson"
+    )
+
+
 @router.post("/confirm", response_model=ImportResult)
 def confirm_import(
     request: ConfirmImportRequest,
@@ -210,4 +311,5 @@ def confirm_import(
             detail=f"Import failed: {str(e)}",
         )
 
+    cache.invalidate(user_id)
     return result
@@ -8,6 +8,7 @@ from app.schemas.onboarding import OnboardingComplete, OnboardingStatus
 from app.models.user_settings import UserSettings
 from app.crud import account as account_crud
 from app.crud import category as category_crud
+from app import cache
 
 router = APIRouter()
 
@@ -28,18 +29,20 @@ def complete_onboarding(
     db: Session = Depends(get_db),
     user_id: str = Depends(get_current_user),
 ):
-    # 1. Create Accounts
-    for acc in payload.accounts:
-        account_crud.create_account(db, acc, user_id)
+    # 1. Build Accounts and Categories (no writes yet)
+    try:
+        accounts = [account_crud.build_account(acc, user_id) for acc in payload.accounts]
+        categories = [
+            category_crud.build_category(db, cat, user_id) for cat in payload.categories
+        ]
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    db.add_all(accounts + categories)
     
-    # 2. Create Categories
-    for cat in payload.categories:
-        category_crud.create_category(db, cat, user_id)
-    
-    # 3. Ensure Transfer Categories
-    category_crud.ensure_transfer_categories(db, user_id)
-    
-    # 4. Update User Settings
+    # 2. Update User Settings
     settings = db.query(UserSettings).filter(UserSettings.user_id == user_id).first()
     if not settings:
         settings = UserSettings(user_id=user_id, has_completed_onboarding=True)
@@ -48,6 +51,13 @@ def complete_onboarding(
         settings.has_completed_onboarding = True
         settings.updated_at = datetime.now(timezone.utc)
     
+    # 3. Ensure Transfer Categories
+    # Flush first so the name lookup sees the new categories; everything above
+    # is written in the same transaction as the transfer categories.
+    db.flush()
+    category_crud.ensure_transfer_categories(db, user_id)
+    
     db.commit()
+    cache.invalidate(user_id)
     
     return {"message": "Onboarding completed successfully"}
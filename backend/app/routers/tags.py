@@ -3,20 +3,37 @@ Tag API routes.
 """
 
 from fastapi import APIRouter, Depends
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
 from app.database import get_db
 from app.auth import get_current_user
 from app.schemas.tag import TagResponse
 from app.crud import tag as crud
+from app import cache
 
 router = APIRouter()
 
+_TAGS_ADAPTER = TypeAdapter(list[TagResponse])
+
 
 @router.get("", response_model=list[TagResponse])
 def list_tags(
     db: Session = Depends(get_db),
     user_id: str = Depends(get_current_user),
 ):
-    """Get all tags for the current user ordered by name."""
-    return crud.get_tags(db, user_id)
+    """
+    Get all tags for the current user ordered by name.
+
+    Cached per user for TAGS_TTL_SECONDS; transaction writes that set tags
+    invalidate the entry.
+    """
+    cached = cache.get(cache.TAGS, user_id)
+    if cached is not None:
+        return cached
+
+    tags = _TAGS_ADAPTER.validate_python(
+        crud.get_tags(db, user_id), from_attributes=True
+    )
+    cache.set(cache.TAGS, user_id, tags, ttl=cache.TAGS_TTL_SECONDS)
+    return tags
@@ -4,45 +4,30 @@ Transaction API routes.
 
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
 from app.database import get_db
 from app.auth import get_current_user
+from app.schemas.common import MONTH_PATTERN
 from app.schemas.transaction import (
     TransactionCreate,
     TransactionUpdate,
     TransactionResponse,
+    TransactionPage,
     TransactionFilter,
+    TransactionType,
     TransferCreate,
     TransferResponse,
 )
 from app.crud import transaction as crud
+from app import cache
 
 router = APIRouter()
 
-
-def transaction_to_response(tx) -> dict:
-    """Convert transaction model to response dict with related data."""
-    return {
-        "id": tx.id,
-        "date": tx.date,
-        "type": tx.type,
-        "amount": tx.amount,
-        "category_id": tx.category_id,
-        "account_id": tx.account_id,
-        "description": tx.description,
-        "is_transfer": tx.is_transfer,
-        "transfer_group_id": tx.transfer_group_id,
-        "hide_from_summary": tx.hide_from_summary,
-        "created_at": tx.created_at,
-        "updated_at": tx.updated_at,
-        "tags": [t.name for t in tx.tags],
-        "category_name": tx.category.name if tx.category else None,
-        "category_color": tx.category.color if tx.category else None,
-        "category_icon": tx.category.icon if tx.category else None,
-        "account_name": tx.account.name if tx.account else None,
-    }
+# Validates and serializes a whole page in pydantic-core; built once at import
+_TRANSACTIONS_ADAPTER = TypeAdapter(list[TransactionResponse])
 
 
 @router.get("/count")
@@ -60,35 +45,87 @@ def count_transactions(
     return {"count": count}
 
 
-@router.get("", response_model=list[TransactionResponse])
+@router.get("", response_model=list[TransactionResponse] | TransactionPage)
 def list_transactions(
     search: str | None = Query(None, description="Search in description"),
-    type: str | None = Query(None, description="Filter by type (income/expense)"),
+    type: TransactionType | None = Query(
+        None, description="Filter by type (income/expense)"
+    ),
     category_id: UUID | None = Query(None, description="Filter by category"),
     account_id: UUID | None = Query(None, description="Filter by account"),
     month: str | None = Query(
-        None, pattern=r"^\d{4}-\d{2}$", description="Filter by month (YYYY-MM)"
+        None, pattern=MONTH_PATTERN, description="Filter by month (YYYY-MM)"
+    ),
+    cursor: str | None = Query(
+        None, description="Cursor from the previous page (X-Next-Cursor)"
+    ),
+    skip: int = Query(
+        0,
+        ge=0,
+        deprecated=True,
+        description="Number of records to skip (ignored when cursor is set)",
     ),
-    skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(50, ge=1, le=100, description="Maximum records to return"),
+    include_total: bool = Query(
+        False, description="Return {items, total} instead of a plain list"
+    ),
     db: Session = Depends(get_db),
     user_id: str = Depends(get_current_user),
 ):
     """
     Get transactions for the current user with filters and pagination.
     Results are ordered by date descending.
+
+    With include_total=true the response is a page object carrying the total
+    number of matching transactions, saving a separate count request.
+
+    Pages are fetched by keyset: pass the X-Next-Cursor header (or the
+    page's next_cursor) back as `cursor` to get the following page. The
+    header is absent on the last page.
     """
-    filters = TransactionFilter(
+    # Every field was already validated as a query parameter
+    filters = TransactionFilter.model_construct(
         search=search,
         type=type,
         category_id=category_id,
         account_id=account_id,
         month=month,
+        cursor=cursor,
         skip=skip,
         limit=limit,
     )
-    transactions = crud.get_transactions(db, filters, user_id)
-    return [transaction_to_response(tx) for tx in transactions]
+    try:
+        if include_total:
+            transactions, total = crud.get_transactions_page(db, filters, user_id)
+        else:
+            transactions = crud.get_transactions(db, filters, user_id)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+    next_cursor = None
+    headers = {}
+    if len(transactions) == limit:
+        next_cursor = crud.encode_cursor(transactions[-1])
+        headers["X-Next-Cursor"] = next_cursor
+
+    # Serialize in one pydantic-core pass instead of letting FastAPI validate
+    # against response_model and encode the result again
+    if include_total:
+        content = TransactionPage.model_validate(
+            {"items": transactions, "total": total, "next_cursor": next_cursor}
+        ).model_dump_json()
+    else:
+        content = _TRANSACTIONS_ADAPTER.dump_json(
+            _TRANSACTIONS_ADAPTER.validate_python(transactions, from_attributes=True)
+        )
+    return Response(
+        content=content,
+        media_type="application/json",
+        headers=headers,
+    )
 
 
 @router.get("/{transaction_id}", response_model=TransactionResponse)
@@ -104,7 +141,7 @@ def get_transaction(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Transaction not found",
         )
-    return transaction_to_response(tx)
+    return tx
 
 
 @router.post(
@@ -120,9 +157,11 @@ def create_transaction(
     Automatically updates account balance and budget spent amount.
     """
     tx = crud.create_transaction(db, data, user_id)
-    # Reload to get relationships
-    tx = crud.get_transaction(db, tx.id, user_id)
-    return transaction_to_response(tx)
+    if data.tags:
+        cache.invalidate(user_id, *cache.DASHBOARD_NAMESPACES, cache.TAGS)
+    else:
+        cache.invalidate(user_id)
+    return tx
 
 
 @router.post(
@@ -145,15 +184,12 @@ def create_transfer(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e),
         )
-
-    # Reload to get relationships
-    outgoing = crud.get_transaction(db, outgoing.id, user_id)
-    incoming = crud.get_transaction(db, incoming.id, user_id)
+    cache.invalidate(user_id)
 
     return {
         "transfer_group_id": outgoing.transfer_group_id,
-        "outgoing_transaction": transaction_to_response(outgoing),
-        "incoming_transaction": transaction_to_response(incoming),
+        "outgoing_transaction": outgoing,
+        "incoming_transaction": incoming,
     }
 
 
@@ -170,14 +206,15 @@ def update_transaction(
     For transfers, updates both linked legs.
     """
     # Check if this is a transfer
-    existing = crud.get_transaction(db, transaction_id, user_id)
-    if not existing:
+    meta = crud.get_transaction_meta(db, transaction_id, user_id)
+    if not meta:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Transaction not found",
         )
+    is_transfer, tx_type = meta
 
-    if existing.is_transfer:
+    if is_transfer:
         # Update both legs of the transfer
         result = crud.update_transfer(db, transaction_id, data, user_id)
         if not result:
@@ -187,10 +224,7 @@ def update_transaction(
             )
         outgoing, incoming = result
         # Return the transaction that was originally requested
-        if existing.type == "expense":
-            tx = crud.get_transaction(db, outgoing.id, user_id)
-        else:
-            tx = crud.get_transaction(db, incoming.id, user_id)
+        tx = outgoing if tx_type == "expense" else incoming
     else:
         tx = crud.update_transaction(db, transaction_id, data, user_id)
         if not tx:
@@ -198,10 +232,12 @@ def update_transaction(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Transaction not found",
             )
-        # Reload to get relationships
-        tx = crud.get_transaction(db, tx.id, user_id)
 
-    return transaction_to_response(tx)
+    if data.tags is not None:
+        cache.invalidate(user_id, *cache.DASHBOARD_NAMESPACES, cache.TAGS)
+    else:
+        cache.invalidate(user_id)
+    return tx
 
 
 @router.delete("/{transaction_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -216,14 +252,15 @@ def delete_transaction(
     For transfers, deletes both linked legs.
     """
     # Check if this is a transfer
-    existing = crud.get_transaction(db, transaction_id, user_id)
-    if not existing:
+    meta = crud.get_transaction_meta(db, transaction_id, user_id)
+    if not meta:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Transaction not found",
         )
+    is_transfer, _ = meta
 
-    if existing.is_transfer:
+    if is_transfer:
         # Delete both legs of the transfer
         deleted = crud.delete_transfer(db, transaction_id, user_id)
     else:
@@ -234,3 +271,4 @@ def delete_transaction(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Transaction not found",
         )
+    cache.invalidate(user_id)
@@ -4,24 +4,31 @@ Pydantic schemas for Account operations.
 
 from datetime import datetime
 from decimal import Decimal
-from typing import Literal, Optional
+from enum import StrEnum
 from uuid import UUID
 
 from pydantic import BaseModel, Field, ConfigDict
 
+from app.schemas.common import HexColor, IconName, Name
 
-# Valid account types
-AccountType = Literal["cash", "bank", "e-wallet", "credit_card"]
+
+class AccountType(StrEnum):
+    """Valid account types."""
+
+    cash = "cash"
+    bank = "bank"
+    e_wallet = "e-wallet"
+    credit_card = "credit_card"
 
 
 class AccountBase(BaseModel):
     """Base schema with common account fields."""
 
-    name: str = Field(..., min_length=1, max_length=100, description="Account name")
+    name: Name = Field(..., description="Account name")
     type: AccountType = Field(..., description="Account type")
     balance: Decimal = Field(default=Decimal("0"), description="Current balance")
-    color: str = Field(..., pattern=r"^#[0-9A-Fa-f]{6}$", description="Hex color code")
-    icon: str = Field(..., min_length=1, max_length=50, description="Lucide icon name")
+    color: HexColor = Field(..., description="Hex color code")
+    icon: IconName = Field(..., description="Lucide icon name")
 
 
 class AccountCreate(AccountBase):
@@ -33,25 +40,28 @@ class AccountCreate(AccountBase):
 class AccountUpdate(BaseModel):
     """Schema for updating an existing account. All fields optional."""
 
-    name: Optional[str] = Field(None, min_length=1, max_length=100)
-    type: Optional[AccountType] = None
-    balance: Optional[Decimal] = None
-    color: Optional[str] = Field(None, pattern=r"^#[0-9A-Fa-f]{6}$")
-    icon: Optional[str] = Field(None, min_length=1, max_length=50)
+    name: Name | None = None
+    type: AccountType | None = None
+    balance: Decimal | None = None
+    color: HexColor | None = None
+    icon: IconName | None = None
+
 
+class AccountResponse(BaseModel):
+    """
+    Schema for account responses.
 
-class AccountResponse(AccountBase):
-    """Schema for account responses."""
+    Declared flat rather than on AccountBase: values come from the database,
+    so the input constraints (lengths, color pattern) aren't re-checked.
+    """
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
     id: UUID
+    name: str
+    type: AccountType
+    balance: Decimal
+    color: str
+    icon: str
     created_at: datetime
     updated_at: datetime
-
-
-
-
-
-
-
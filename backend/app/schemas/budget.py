@@ -4,39 +4,37 @@ Pydantic schemas for Budget operations.
 
 from datetime import datetime, date
 from decimal import Decimal
-from typing import Literal, Optional
+from enum import StrEnum
 from uuid import UUID
 
-from pydantic import BaseModel, Field, ConfigDict, field_validator
+from pydantic import BaseModel, Field, ConfigDict
 
+from app.schemas.common import MONTH_PATTERN
 
-# Budget status types
-BudgetStatus = Literal["safe", "warning", "over"]
+
+class BudgetStatus(StrEnum):
+    """Budget status types."""
+
+    safe = "safe"
+    warning = "warning"
+    over = "over"
 
 
 class BudgetCreate(BaseModel):
     """Schema for creating a new budget."""
 
     category_id: UUID = Field(..., description="Category ID")
+    # The pattern also rejects months outside 01-12
     month: str = Field(
-        ..., pattern=r"^\d{4}-\d{2}$", description="Month in YYYY-MM format"
+        ..., pattern=MONTH_PATTERN, description="Month in YYYY-MM format"
     )
     limit_amount: Decimal = Field(..., gt=0, description="Budget limit amount")
 
-    @field_validator("month")
-    @classmethod
-    def validate_month(cls, v: str) -> str:
-        """Validate month format."""
-        year, month = v.split("-")
-        if not (1 <= int(month) <= 12):
-            raise ValueError("Month must be between 01 and 12")
-        return v
-
 
 class BudgetUpdate(BaseModel):
     """Schema for updating an existing budget."""
 
-    limit_amount: Optional[Decimal] = Field(
+    limit_amount: Decimal | None = Field(
         None, gt=0, description="Budget limit amount"
     )
 
@@ -44,7 +42,7 @@ class BudgetUpdate(BaseModel):
 class BudgetResponse(BaseModel):
     """Schema for budget responses."""
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
     id: UUID
     category_id: UUID
@@ -56,16 +54,9 @@ class BudgetResponse(BaseModel):
 
     # Computed fields (from model properties)
     percentage_used: float = Field(default=0.0)
-    status: BudgetStatus = Field(default="safe")
+    status: BudgetStatus = Field(default=BudgetStatus.safe)
 
     # Category info (populated in router)
-    category_name: Optional[str] = None
-    category_color: Optional[str] = None
-    category_icon: Optional[str] = None
-
-
-
-
-
-
-
+    category_name: str | None = None
+    category_color: str | None = None
+    category_icon: str | None = None
@@ -3,29 +3,34 @@ Pydantic schemas for Category operations.
 """
 
 from datetime import datetime
-from typing import Literal, Optional
+from enum import StrEnum
 from uuid import UUID
 
 from pydantic import BaseModel, Field, ConfigDict
 
+from app.schemas.common import HexColor, IconName, Name
 
-# Valid category types
-CategoryType = Literal["income", "expense"]
+
+class CategoryType(StrEnum):
+    """Valid category types."""
+
+    income = "income"
+    expense = "expense"
 
 
 class CategoryBase(BaseModel):
     """Base schema with common category fields."""
 
-    name: str = Field(..., min_length=1, max_length=100, description="Category name")
+    name: Name = Field(..., description="Category name")
     type: CategoryType = Field(..., description="income or expense")
-    color: str = Field(..., pattern=r"^#[0-9A-Fa-f]{6}$", description="Hex color code")
-    icon: str = Field(..., min_length=1, max_length=50, description="Lucide icon name")
+    color: HexColor = Field(..., description="Hex color code")
+    icon: IconName = Field(..., description="Lucide icon name")
 
 
 class CategoryCreate(CategoryBase):
     """Schema for creating a new category."""
 
-    parent_id: Optional[UUID] = Field(
+    parent_id: UUID | None = Field(
         None, description="Parent category ID (for subcategories)"
     )
 
@@ -33,20 +38,29 @@ class CategoryCreate(CategoryBase):
 class CategoryUpdate(BaseModel):
     """Schema for updating an existing category. All fields optional."""
 
-    name: Optional[str] = Field(None, min_length=1, max_length=100)
-    type: Optional[CategoryType] = None
-    color: Optional[str] = Field(None, pattern=r"^#[0-9A-Fa-f]{6}$")
-    icon: Optional[str] = Field(None, min_length=1, max_length=50)
-    parent_id: Optional[UUID] = None
+    name: Name | None = None
+    type: CategoryType | None = None
+    color: HexColor | None = None
+    icon: IconName | None = None
+    parent_id: UUID | None = None
+
 
+class CategoryResponse(BaseModel):
+    """
+    Schema for category responses.
 
-class CategoryResponse(CategoryBase):
-    """Schema for category responses."""
+    Declared flat rather than on CategoryBase: values come from the database,
+    so the input constraints (lengths, color pattern) aren't re-checked.
+    """
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
     id: UUID
-    parent_id: Optional[UUID] = None
+    name: str
+    type: CategoryType
+    color: str
+    icon: str
+    parent_id: UUID | None = None
     is_system: bool = False
     created_at: datetime
     updated_at: datetime
@@ -55,4 +69,4 @@ class CategoryResponse(CategoryBase):
 class CategoryWithChildren(CategoryResponse):
     """Schema for category with nested children (hierarchical view)."""
 
-    children: list["CategoryResponse"] = Field(default_factory=list)
+    children: list[CategoryResponse] = Field(default_factory=list)
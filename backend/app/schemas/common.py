@@ -0,0 +1,23 @@
+"""
+Shared constrained types and patterns for Pydantic schemas.
+"""
+
+from typing import Annotated
+
+from pydantic import StringConstraints
+
+
+# Defined once so every schema shares the same pattern instead of repeating it
+HEX_COLOR_PATTERN = r"^#[0-9A-Fa-f]{6}$"
+
+# YYYY-MM with the month range checked by the pattern itself
+MONTH_PATTERN = r"^\d{4}-(0[1-9]|1[0-2])$"
+
+# Hex color code such as "#3B82F6"
+HexColor = Annotated[str, StringConstraints(pattern=HEX_COLOR_PATTERN)]
+
+# Display name for accounts, categories and import profiles
+Name = Annotated[str, StringConstraints(min_length=1, max_length=100)]
+
+# Lucide icon name
+IconName = Annotated[str, StringConstraints(min_length=1, max_length=50)]
@@ -2,26 +2,29 @@
 Pydantic schemas for Dashboard operations.
 """
 
-from decimal import Decimal
 from typing import List
 
 from pydantic import BaseModel, Field
 
 
+# Display aggregates are floats: they serialize as JSON numbers without the
+# Decimal round trip. Ledger values elsewhere stay Decimal.
+
+
 class MonthlyActivity(BaseModel):
     """Monthly income and expense data."""
 
     month: str = Field(..., description="Month name/label (e.g., 'Jan')")
-    income: Decimal = Field(..., description="Total income")
-    expense: Decimal = Field(..., description="Total expense")
+    income: float = Field(..., description="Total income")
+    expense: float = Field(..., description="Total expense")
 
 
 class DashboardStats(BaseModel):
     """Dashboard statistics response."""
 
-    total_balance: Decimal = Field(..., description="Sum of all account balances")
-    monthly_income: Decimal = Field(..., description="Total income for current month")
-    monthly_expense: Decimal = Field(
+    total_balance: float = Field(..., description="Sum of all account balances")
+    monthly_income: float = Field(..., description="Total income for current month")
+    monthly_expense: float = Field(
         ..., description="Total expenses for current month"
     )
     chart_data: List[MonthlyActivity] = Field(
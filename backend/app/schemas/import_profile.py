@@ -4,20 +4,42 @@ Pydantic schemas for Import Profile operations.
 
 from datetime import datetime
 from decimal import Decimal
-from typing import Literal, Optional
+from enum import StrEnum
+from typing import Any
 from uuid import UUID
 
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import (
+    BaseModel,
+    Field,
+    ConfigDict,
+    TypeAdapter,
+    ModelWrapValidatorHandler,
+    model_validator,
+)
+from pydantic.dataclasses import dataclass
 
+from app.schemas.common import Name
 
-# Valid mapping types
-MappingType = Literal["category", "account"]
+
+class MappingType(StrEnum):
+    """Valid mapping types."""
+
+    category = "category"
+    account = "account"
+
+
+class PreviewRowType(StrEnum):
+    """How a preview row will be imported."""
+
+    income = "income"
+    expense = "expense"
+    transfer = "transfer"
 
 
 class ImportProfileBase(BaseModel):
     """Base schema with common import profile fields."""
 
-    name: str = Field(..., min_length=1, max_length=100, description="Profile name")
+    name: Name = Field(..., description="Profile name")
     column_mapping: dict = Field(..., description="Column mapping configuration")
 
 
@@ -27,12 +49,14 @@ class ImportProfileCreate(ImportProfileBase):
     pass
 
 
-class ImportProfileResponse(ImportProfileBase):
-    """Schema for import profile responses."""
+class ImportProfileResponse(BaseModel):
+    """Schema for import profile responses (flat; no input constraints)."""
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
     id: UUID
+    name: str
+    column_mapping: dict
     created_at: datetime
     updated_at: datetime
 
@@ -54,7 +78,7 @@ class ImportValueMappingCreate(ImportValueMappingBase):
 class ImportValueMappingResponse(ImportValueMappingBase):
     """Schema for value mapping responses."""
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
     id: UUID
     profile_id: UUID
@@ -69,6 +93,9 @@ class ImportValueMappingResponse(ImportValueMappingBase):
 class ParsedRow(BaseModel):
     """A single parsed row from the import file."""
 
+    # Rows are never modified after parsing; unknown keys are client errors
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     row_index: int = Field(..., description="Row index in the file (0-based)")
     external_id: str = Field(..., description="External ID from CSV")
     date: str = Field(..., description="Original date string from CSV")
@@ -78,6 +105,10 @@ class ParsedRow(BaseModel):
     description: str = Field(..., description="Transaction description")
 
 
+# Serializes single rows when streaming a parse result; built once at import
+PARSED_ROW_ADAPTER = TypeAdapter(ParsedRow)
+
+
 class ParseResult(BaseModel):
     """Result of parsing an import file."""
 
@@ -90,24 +121,59 @@ class ParseResult(BaseModel):
     unmapped_accounts: list[str] = Field(
         ..., description="Distinct account values not yet mapped"
     )
-    existing_category_mappings: dict[str, str] = Field(
+    existing_category_mappings: dict[str, UUID] = Field(
         ..., description="Already mapped: csv_value -> category_id"
     )
-    existing_account_mappings: dict[str, str] = Field(
+    existing_account_mappings: dict[str, UUID] = Field(
         ..., description="Already mapped: csv_value -> account_id"
     )
+    rows_signature: str | None = Field(
+        None, description="Server signature over parsed_rows; echo it on confirm"
+    )
 
 
 class MappingItem(BaseModel):
     """A single mapping from CSV value to internal ID."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     csv_value: str = Field(..., description="Original CSV value")
     internal_id: UUID = Field(..., description="Target internal ID")
 
 
-class ConfirmImportRequest(BaseModel):
+class _SignedRowsRequest(BaseModel):
+    """
+    Base for request bodies echoing parsed_rows with their rows_signature.
+
+    Rows sent back unchanged from /parse carry the server's signature, so
+    they are rebuilt without validation and only the envelope is checked.
+    Any other body is validated in full.
+    """
+
+    @model_validator(mode="wrap")
+    @classmethod
+    def _trust_signed_rows(
+        cls, data: Any, handler: ModelWrapValidatorHandler
+    ) -> "_SignedRowsRequest":
+        # Imported here: the import service depends on this module
+        from app.services.import_service import load_signed_rows
+
+        if isinstance(data, dict):
+            rows = load_signed_rows(
+                data.get("parsed_rows"), data.get("rows_signature")
+            )
+            if rows is not None:
+                request = handler({**data, "parsed_rows": []})
+                request.parsed_rows = rows
+                return request
+        return handler(data)
+
+
+class ConfirmImportRequest(_SignedRowsRequest):
     """Request to confirm and execute the import."""
 
+    model_config = ConfigDict(defer_build=True)
+
     profile_id: UUID = Field(..., description="Import profile ID")
     category_mappings: list[MappingItem] = Field(
         default_factory=list, description="New category mappings to persist"
@@ -119,6 +185,9 @@ class ConfirmImportRequest(BaseModel):
     excluded_indices: list[int] = Field(
         default_factory=list, description="Row indices to skip"
     )
+    rows_signature: str | None = Field(
+        None, description="rows_signature from the parse result"
+    )
 
 
 class ImportResult(BaseModel):
@@ -139,25 +208,33 @@ class ImportResult(BaseModel):
 # =============================================================================
 
 
-class PreviewRow(BaseModel):
-    """A single row in the import preview with resolved values."""
+@dataclass(slots=True, kw_only=True)
+class PreviewRow:
+    """
+    A single row in the import preview with resolved values.
+
+    Output-only and built once per row, so a slotted pydantic dataclass
+    instead of a BaseModel; the transfer pass updates it in place.
+    """
 
     row_index: int = Field(..., description="Row index in the file (0-based)")
     external_id: str = Field(..., description="External ID from CSV")
     date: str = Field(..., description="Original date string from CSV")
-    parsed_date: Optional[str] = Field(None, description="ISO format date if parseable")
+    parsed_date: str | None = Field(None, description="ISO format date if parseable")
     amount: Decimal = Field(..., description="Amount (can be negative)")
-    type: str = Field(..., description="Transaction type: income, expense, or transfer")
+    type: PreviewRowType = Field(
+        ..., description="Transaction type; transfer rows are transfer legs"
+    )
     description: str = Field(..., description="Transaction description")
 
     # Resolved values
     category_value: str = Field(..., description="Original CSV category value")
-    category_id: Optional[UUID] = Field(None, description="Resolved category ID")
-    category_name: Optional[str] = Field(None, description="Resolved category name")
+    category_id: UUID | None = Field(None, description="Resolved category ID")
+    category_name: str | None = Field(None, description="Resolved category name")
 
     account_value: str = Field(..., description="Original CSV account value")
-    account_id: Optional[UUID] = Field(None, description="Resolved account ID")
-    account_name: Optional[str] = Field(None, description="Resolved account name")
+    account_id: UUID | None = Field(None, description="Resolved account ID")
+    account_name: str | None = Field(None, description="Resolved account name")
 
     # Validation
     is_valid: bool = Field(..., description="Whether row can be imported")
@@ -166,12 +243,15 @@ class PreviewRow(BaseModel):
     )
 
     # Transfer pairing
-    is_transfer: bool = Field(default=False, description="Is part of a transfer pair")
-    transfer_pair_index: Optional[int] = Field(
+    transfer_pair_index: int | None = Field(
         None, description="Row index of paired transfer leg"
     )
 
 
+# Serializes single rows when streaming a preview; built once at import
+PREVIEW_ROW_ADAPTER = TypeAdapter(PreviewRow)
+
+
 class PreviewResult(BaseModel):
     """Result of generating an import preview."""
 
@@ -183,9 +263,11 @@ class PreviewResult(BaseModel):
     warnings: list[str] = Field(default_factory=list, description="General warnings")
 
 
-class PreviewRequest(BaseModel):
+class PreviewRequest(_SignedRowsRequest):
     """Request to generate an import preview."""
 
+    model_config = ConfigDict(defer_build=True)
+
     profile_id: UUID = Field(..., description="Import profile ID")
     parsed_rows: list[ParsedRow] = Field(..., description="Rows from parse step")
     category_mappings: list[MappingItem] = Field(
@@ -194,3 +276,6 @@ class PreviewRequest(BaseModel):
     account_mappings: list[MappingItem] = Field(
         default_factory=list, description="Account mappings (including new ones)"
     )
+    rows_signature: str | None = Field(
+        None, description="rows_signature from the parse result"
+    )
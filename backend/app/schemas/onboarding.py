@@ -1,13 +1,18 @@
 from typing import List
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from app.schemas.account import AccountCreate
 from app.schemas.category import CategoryCreate
 
 class OnboardingComplete(BaseModel):
+    # Used once per user; build the schema on first use, not at import
+    model_config = ConfigDict(defer_build=True)
+
     accounts: List[AccountCreate]
     categories: List[CategoryCreate]
 
 class OnboardingStatus(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     has_completed_onboarding: bool
 
@@ -11,15 +11,8 @@ from pydantic import BaseModel, ConfigDict
 class TagResponse(BaseModel):
     """Schema for tag responses."""
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
     id: UUID
     name: str
     created_at: datetime
-
-
-
-
-
-
-
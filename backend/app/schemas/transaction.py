@@ -4,14 +4,19 @@ Pydantic schemas for Transaction operations.
 
 from datetime import datetime
 from decimal import Decimal
-from typing import Literal, Optional
+from enum import StrEnum
 from uuid import UUID
 
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import AliasChoices, BaseModel, Field, ConfigDict
 
+from app.schemas.common import MONTH_PATTERN
 
-# Valid transaction types
-TransactionType = Literal["income", "expense"]
+
+class TransactionType(StrEnum):
+    """Valid transaction types."""
+
+    income = "income"
+    expense = "expense"
 
 
 class TransactionBase(BaseModel):
@@ -36,19 +41,25 @@ class TransactionCreate(TransactionBase):
 class TransactionUpdate(BaseModel):
     """Schema for updating an existing transaction. All fields optional."""
 
-    date: Optional[datetime] = None
-    type: Optional[TransactionType] = None
-    amount: Optional[Decimal] = Field(None, gt=0)
-    category_id: Optional[UUID] = None
-    account_id: Optional[UUID] = None
-    description: Optional[str] = Field(None, min_length=1, max_length=500)
-    tags: Optional[list[str]] = None
+    date: datetime | None = None
+    type: TransactionType | None = None
+    amount: Decimal | None = Field(None, gt=0)
+    category_id: UUID | None = None
+    account_id: UUID | None = None
+    description: str | None = Field(None, min_length=1, max_length=500)
+    tags: list[str] | None = None
 
 
 class TransactionResponse(TransactionBase):
-    """Schema for transaction responses."""
+    """
+    Schema for transaction responses.
 
-    model_config = ConfigDict(from_attributes=True)
+    Built straight from a Transaction ORM row with model_validate(); related
+    values are read through validation aliases (tag_list and the denormalized
+    *_snapshot columns). The field names stay accepted for plain dict input.
+    """
+
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
     id: UUID
     created_at: datetime
@@ -56,29 +67,58 @@ class TransactionResponse(TransactionBase):
 
     # Transfer fields
     is_transfer: bool = False
-    transfer_group_id: Optional[str] = None
+    transfer_group_id: str | None = None
     hide_from_summary: bool = False
 
-    # Related data (populated in router)
-    tags: list[str] = Field(default_factory=list)
-    category_name: Optional[str] = None
-    category_color: Optional[str] = None
-    category_icon: Optional[str] = None
-    account_name: Optional[str] = None
+    # Related data: tags from tag_list, the rest from the *_snapshot columns,
+    # which category and account writes keep in sync (no relationship fallback)
+    tags: tuple[str, ...] = Field(
+        default_factory=tuple,
+        validation_alias=AliasChoices("tag_list", "tags"),
+    )
+    category_name: str | None = Field(
+        None,
+        validation_alias=AliasChoices("category_name", "category_name_snapshot"),
+    )
+    category_color: str | None = Field(
+        None,
+        validation_alias=AliasChoices("category_color", "category_color_snapshot"),
+    )
+    category_icon: str | None = Field(
+        None,
+        validation_alias=AliasChoices("category_icon", "category_icon_snapshot"),
+    )
+    account_name: str | None = Field(
+        None,
+        validation_alias=AliasChoices("account_name", "account_name_snapshot"),
+    )
+
+
+class TransactionPage(BaseModel):
+    """Schema for a page of transactions with the total matching count."""
+
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
+
+    items: list[TransactionResponse]
+    total: int
+    next_cursor: str | None = None
 
 
 class TransactionFilter(BaseModel):
     """Schema for transaction query filters."""
 
-    search: Optional[str] = Field(None, description="Search in description")
-    type: Optional[TransactionType] = Field(None, description="Filter by type")
-    category_id: Optional[UUID] = Field(None, description="Filter by category")
-    account_id: Optional[UUID] = Field(None, description="Filter by account")
-    month: Optional[str] = Field(
-        None, pattern=r"^\d{4}-\d{2}$", description="Filter by month (YYYY-MM)"
+    search: str | None = Field(None, description="Search in description")
+    type: TransactionType | None = Field(None, description="Filter by type")
+    category_id: UUID | None = Field(None, description="Filter by category")
+    account_id: UUID | None = Field(None, description="Filter by account")
+    month: str | None = Field(
+        None, pattern=MONTH_PATTERN, description="Filter by month (YYYY-MM)"
     )
 
     # Pagination
+    cursor: str | None = Field(
+        None, description="Opaque cursor from the previous page"
+    )
     skip: int = Field(default=0, ge=0, description="Number of records to skip")
     limit: int = Field(
         default=50, ge=1, le=100, description="Maximum records to return"
@@ -88,6 +128,8 @@ class TransactionFilter(BaseModel):
 class TransferCreate(BaseModel):
     """Schema for creating a transfer between accounts."""
 
+    model_config = ConfigDict(defer_build=True)
+
     from_account_id: UUID = Field(..., description="Source account ID")
     to_account_id: UUID = Field(..., description="Destination account ID")
     amount: Decimal = Field(..., gt=0, description="Transfer amount (positive)")
@@ -103,7 +145,7 @@ class TransferCreate(BaseModel):
 class TransferResponse(BaseModel):
     """Schema for transfer response with both legs."""
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
     transfer_group_id: str
     outgoing_transaction: TransactionResponse
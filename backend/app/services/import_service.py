@@ -3,10 +3,20 @@ Import Service - handles parsing and importing transaction files.
 """
 
 import csv
+import hashlib
+import hmac
 import io
-from collections import defaultdict
+import json
+import re
+import secrets
+from collections import defaultdict, deque
+from collections.abc import Iterable, Iterator
 from datetime import datetime
 from decimal import Decimal, InvalidOperation
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter
+from typing import BinaryIO
 from uuid import UUID
 
 from sqlalchemy.orm import Session
@@ -19,12 +29,19 @@ from app.schemas.import_profile import (
     PreviewRow,
     PreviewResult,
 )
+from app.models.category import Category
 from app.schemas.transaction import TransactionCreate, TransferCreate
+from app.config import settings
 from app.crud import import_profile as import_crud
 from app.crud import transaction as transaction_crud
 from app.crud import category as category_crud
 from app.crud import account as account_crud
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # Expected column headers (case-insensitive)
 EXPECTED_COLUMNS = {
@@ -37,6 +54,59 @@ EXPECTED_COLUMNS = {
 }
 
 
+# Date shapes handled without strptime: day/month first with a separator, or ISO
+_DMY_DATE_RE = re.compile(r"(\d{1,2})([/.-])(\d{1,2})\2(\d{4})")
+_ISO_DATE_RE = re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})")
+
+# Thousands separators and the dollar sign, dropped from amounts in one pass
+_AMOUNT_STRIP = str.maketrans("", "", ",$")
+
+
+_SIGNING_KEY = (
+    settings.IMPORT_SIGNING_KEY.encode()
+    if settings.IMPORT_SIGNING_KEY
+    else secrets.token_bytes(32)
+)
+
+
+def _rows_digest(rows: list[dict]) -> str:
+    """HMAC over a canonical JSON encoding of JSON-mode row dicts."""
+    if orjson is not None:
+        canonical = orjson.dumps(rows, option=orjson.OPT_SORT_KEYS)
+    else:
+        canonical = json.dumps(rows, sort_keys=True, separators=(",", ":")).encode()
+    return hmac.new(_SIGNING_KEY, canonical, hashlib.sha256).hexdigest()
+
+
+def sign_rows(parsed_rows: list[ParsedRow]) -> str:
+    """Sign parsed rows so the confirm step can trust them unvalidated."""
+    return _rows_digest([row.model_dump(mode="json") for row in parsed_rows])
+
+
+def load_signed_rows(rows: object, signature: object) -> list[ParsedRow] | None:
+    """
+    Build ParsedRows from a decoded request payload without validation.
+
+    Returns None unless the rows carry a valid signature from sign_rows, in
+    which case they are exactly what the server produced and only the JSON
+    amount string needs converting back to Decimal.
+    """
+    if not isinstance(rows, list) or not isinstance(signature, str):
+        return None
+    try:
+        digest = _rows_digest(rows)
+    except TypeError:
+        # Not encodable the way the server encodes rows (e.g. an int over
+        # 64 bits for orjson), so it can't be a signed payload
+        return None
+    if not hmac.compare_digest(digest, signature):
+        return None
+    return [
+        ParsedRow.model_construct(**{**row, "amount": Decimal(row["amount"])})
+        for row in rows
+    ]
+
+
 def normalize_header(header: str) -> str:
     """Normalize a header string for matching."""
     return header.strip().lower()
@@ -51,56 +121,80 @@ def find_column_index(headers: list[str], column_key: str) -> int | None:
     return None
 
 
-def parse_csv_content(content: bytes) -> tuple[list[str], list[list[str]]]:
+def parse_csv_content(file: BinaryIO) -> tuple[list[str], list[list[str]]]:
     """
     Parse CSV content and return headers and rows.
-    Tries different encodings.
+    Tries different encodings, decoding the file incrementally and rewinding
+    it between attempts instead of holding a decoded copy in memory.
     """
     for encoding in ["utf-8", "utf-8-sig", "latin-1", "cp1252"]:
+        file.seek(0)
+        text = io.TextIOWrapper(file, encoding=encoding, newline="")
         try:
-            text = content.decode(encoding)
-            reader = csv.reader(io.StringIO(text))
-            rows = list(reader)
+            rows = list(csv.reader(text))
             if rows:
                 return rows[0], rows[1:]
         except (UnicodeDecodeError, csv.Error):
             continue
+        finally:
+            # Release the underlying file so the wrapper doesn't close it
+            text.detach()
 
     raise ValueError("Unable to parse CSV file. Please check the file encoding.")
 
 
-def parse_excel_content(content: bytes) -> tuple[list[str], list[list[str]]]:
+def _iter_sheet_rows(wb, ws) -> Iterator[tuple]:
+    """Yield raw cell values row by row, closing the workbook when done."""
+    try:
+        yield from ws.iter_rows(values_only=True)
+    finally:
+        wb.close()
+
+
+def parse_excel_content(file: BinaryIO) -> tuple[list[str], Iterator[tuple]]:
     """
     Parse Excel content and return headers and rows.
+
+    Data rows are streamed from the read-only workbook as raw cell values
+    (None, numbers, dates or strings); parse_file converts only the cells it
+    reads. The workbook is closed once the rows are consumed or discarded.
     """
     try:
         from openpyxl import load_workbook
     except ImportError:
         raise ValueError("Excel support requires openpyxl. Please install it.")
 
-    wb = load_workbook(filename=io.BytesIO(content), read_only=True, data_only=True)
+    file.seek(0)
+    wb = load_workbook(filename=file, read_only=True, data_only=True)
     ws = wb.active
 
     if ws is None:
+        wb.close()
         raise ValueError("Excel file has no active worksheet.")
 
-    rows = []
-    for row in ws.iter_rows(values_only=True):
-        # Convert None to empty string, ensure all values are strings
-        rows.append([str(cell) if cell is not None else "" for cell in row])
-
-    if not rows:
+    rows = _iter_sheet_rows(wb, ws)
+    header_row = next(rows, None)
+    if header_row is None:
         raise ValueError("Excel file contains no data.")
 
-    return rows[0], rows[1:]
+    headers = [str(cell) if cell is not None else "" for cell in header_row]
+    return headers, rows
 
 
-def parse_file(file_content: bytes, filename: str) -> list[ParsedRow]:
+def _parse_amount(amount_str: str) -> Decimal | None:
+    """Parse an amount cell, ignoring currency symbols and thousands separators."""
+    try:
+        return Decimal(amount_str.translate(_AMOUNT_STRIP).replace("Rp", "").strip())
+    except (InvalidOperation, ValueError):
+        return None
+
+
+def parse_file(file: BinaryIO | bytes, filename: str) -> list[ParsedRow]:
     """
     Parse an import file and return a list of ParsedRow objects.
 
     Args:
-        file_content: Raw file bytes
+        file: Seekable binary file (e.g. the upload's spooled file) or raw bytes
         filename: Original filename (used to detect format)
 
     Returns:
@@ -111,17 +205,24 @@ def parse_file(file_content: bytes, filename: str) -> list[ParsedRow]:
     """
     filename_lower = filename.lower()
 
+    if isinstance(file, bytes):
+        file = io.BytesIO(file)
+
     if filename_lower.endswith(".csv"):
-        headers, data_rows = parse_csv_content(file_content)
+        headers, data_rows = parse_csv_content(file)
     elif filename_lower.endswith((".xlsx", ".xls")):
-        headers, data_rows = parse_excel_content(file_content)
+        headers, data_rows = parse_excel_content(file)
     else:
         raise ValueError(
             f"Unsupported file format. Please use CSV or Excel (.xlsx). Got: {filename}"
         )
 
-    if not data_rows:
+    # Rows may be streamed, so check for the first one without a len()
+    data_rows = iter(data_rows)
+    first_row = next(data_rows, None)
+    if first_row is None:
         raise ValueError("File contains no data rows.")
+    data_rows = chain([first_row], data_rows)
 
     # Find column indices
     col_indices = {}
@@ -137,43 +238,43 @@ def parse_file(file_content: bytes, filename: str) -> list[ParsedRow]:
     if missing_columns:
         raise ValueError(f"Missing required columns: {', '.join(missing_columns)}")
 
+    # Only the six mapped columns are read; fetch them from a row in one call
+    field_indices = [
+        col_indices[key]
+        for key in ("id", "date", "categories", "amount", "accounts", "description")
+    ]
+    get_fields = itemgetter(*field_indices)
+    min_row_length = max(field_indices) + 1
+
     # Parse each row
     parsed_rows = []
     for row_index, row in enumerate(data_rows):
-        # Skip empty rows
-        if not any(cell.strip() for cell in row):
-            continue
-
-        # Safely get values with bounds checking
-        def get_value(key: str) -> str:
-            idx = col_indices[key]
-            if idx < len(row):
-                return row[idx].strip()
-            return ""
-
-        external_id = get_value("id")
-        date_str = get_value("date")
-        category_value = get_value("categories")
-        amount_str = get_value("amount")
-        account_value = get_value("accounts")
-        description = get_value("description")
-
-        # Skip rows without essential data
+        if len(row) >= min_row_length:
+            cells = get_fields(row)
+        else:
+            # Short row: missing trailing cells read as empty
+            cells = [row[i] if i < len(row) else "" for i in field_indices]
+
+        (
+            external_id,
+            date_str,
+            category_value,
+            amount_str,
+            account_value,
+            description,
+        ) = ("" if cell is None else str(cell).strip() for cell in cells)
+
+        # Skip rows without essential data (this also skips blank rows)
         if not date_str or not amount_str:
             continue
 
-        # Parse amount
-        try:
-            # Remove currency symbols and thousands separators
-            amount_clean = (
-                amount_str.replace(",", "").replace("$", "").replace("Rp", "").strip()
-            )
-            amount = Decimal(amount_clean)
-        except (InvalidOperation, ValueError):
+        amount = _parse_amount(amount_str)
+        if amount is None:
             continue  # Skip rows with invalid amounts
 
+        # Every value is already the declared type, so skip validation
         parsed_rows.append(
-            ParsedRow(
+            ParsedRow.model_construct(
                 row_index=row_index,
                 external_id=external_id,
                 date=date_str,
@@ -210,16 +311,9 @@ def analyze_mappings(
             account_values.add(row.account_value)
 
     # Get existing mappings
-    existing_category_mappings = import_crud.get_value_mappings_dict(
-        db, profile_id, "category"
-    )
-    existing_account_mappings = import_crud.get_value_mappings_dict(
-        db, profile_id, "account"
-    )
-
-    # Convert UUIDs to strings for JSON serialization
-    existing_cat_str = {k: str(v) for k, v in existing_category_mappings.items()}
-    existing_acc_str = {k: str(v) for k, v in existing_account_mappings.items()}
+    existing_mappings = import_crud.get_value_mappings_by_type(db, profile_id)
+    existing_category_mappings = existing_mappings["category"]
+    existing_account_mappings = existing_mappings["account"]
 
     # Determine unmapped values
     unmapped_categories = [
@@ -229,22 +323,56 @@ def analyze_mappings(
         v for v in account_values if v not in existing_account_mappings
     ]
 
-    return ParseResult(
+    # Built from trusted server-side values, so skip validation
+    return ParseResult.model_construct(
         profile_id=profile_id,
         total_rows=len(parsed_rows),
         parsed_rows=parsed_rows,
         unmapped_categories=sorted(unmapped_categories),
         unmapped_accounts=sorted(unmapped_accounts),
-        existing_category_mappings=existing_cat_str,
-        existing_account_mappings=existing_acc_str,
+        existing_category_mappings=existing_category_mappings,
+        existing_account_mappings=existing_account_mappings,
+        rows_signature=sign_rows(parsed_rows),
     )
 
 
+@lru_cache(maxsize=8192)
 def parse_date(date_str: str) -> datetime | None:
     """
     Parse a date string in various formats.
     Primary format: dd/MM/yyyy
+
+    Memoized: an import repeats the same few hundred dates across many rows,
+    and preview, transfer pairing and import each parse them again.
+
+    Common shapes are matched with a regex and built directly, trying the
+    same field orders as the strptime formats below, in the same order.
+    Anything else falls back to the strptime loop.
     """
+    date_str = date_str.strip()
+
+    match = _DMY_DATE_RE.fullmatch(date_str)
+    if match:
+        first, sep, second, year = match.groups()
+        # dd/MM, dd-MM and dd.MM; slashes may also be US MM/dd
+        orders = [(first, second)]
+        if sep == "/":
+            orders.append((second, first))
+        for day, month in orders:
+            try:
+                return datetime(int(year), int(month), int(day))
+            except ValueError:
+                continue
+        return None
+
+    match = _ISO_DATE_RE.fullmatch(date_str)
+    if match:
+        year, month, day = match.groups()
+        try:
+            return datetime(int(year), int(month), int(day))
+        except ValueError:
+            return None
+
     formats = [
         "%d/%m/%Y",  # dd/MM/yyyy
         "%d-%m-%Y",  # dd-MM-yyyy
@@ -255,32 +383,34 @@ def parse_date(date_str: str) -> datetime | None:
 
     for fmt in formats:
         try:
-            return datetime.strptime(date_str.strip(), fmt)
+            return datetime.strptime(date_str, fmt)
         except ValueError:
             continue
 
     return None
 
 
-def get_transfer_category_ids(db: Session, user_id: str) -> dict[str, UUID] | None:
+def get_transfer_category_ids(
+    categories: Iterable[Category],
+) -> dict[str, UUID] | None:
     """
-    Get the transfer category IDs for a user.
+    Find the transfer category IDs among a user's categories.
     Returns {"incoming": UUID, "outgoing": UUID} or None if not found.
 
-    Looks for categories by name at any level - works for both:
+    Takes the category list the caller already loaded, so no query is needed.
+    Matches by name at any level - works for both:
     - New users: root-level transfer categories
     - Existing users: transfer categories under "Transfer" parent (backward compatible)
     """
-    # Find transfer categories by name (any level, for backward compatibility)
-    incoming = category_crud.get_category_by_name(
-        db, "Incoming transfer", user_id, any_parent=True
-    )
-    outgoing = category_crud.get_category_by_name(
-        db, "Outgoing transfer", user_id, any_parent=True
-    )
+    ids: dict[str, UUID] = {}
+    for category in categories:
+        if category.name == "Incoming transfer":
+            ids.setdefault("incoming", category.id)
+        elif category.name == "Outgoing transfer":
+            ids.setdefault("outgoing", category.id)
 
-    if incoming and outgoing:
-        return {"incoming": incoming.id, "outgoing": outgoing.id}
+    if len(ids) == 2:
+        return ids
 
     return None
 
@@ -325,33 +455,39 @@ def detect_transfer_pairs(
     transfer_pairs = []
     unmatched = []
 
-    for key, group_rows in groups.items():
-        # Separate into outgoing (negative) and incoming (positive)
+    for group_rows in groups.values():
+        # Separate into outgoing (negative) and incoming (positive); incoming
+        # rows are queued per account with their position in the group
         outgoing_candidates = [r for r in group_rows if r.amount < 0]
-        incoming_candidates = [r for r in group_rows if r.amount > 0]
-
-        # Match pairs - ensure different accounts
-        matched_outgoing = set()
-        matched_incoming = set()
+        incoming_by_account: dict[str, deque[tuple[int, ParsedRow]]] = defaultdict(
+            deque
+        )
+        for position, row in enumerate(r for r in group_rows if r.amount > 0):
+            incoming_by_account[row.account_value].append((position, row))
 
+        # Match each outgoing row with the earliest unmatched incoming row
+        # from a different account. Only a queue head can be that row, so
+        # matched rows are never rescanned.
         for out_row in outgoing_candidates:
-            out_account = out_row.account_value
-            for in_row in incoming_candidates:
-                in_account = in_row.account_value
-                # Must be different accounts and not already matched
-                if out_account != in_account and id(in_row) not in matched_incoming:
-                    transfer_pairs.append((out_row, in_row))
-                    matched_outgoing.add(id(out_row))
-                    matched_incoming.add(id(in_row))
-                    break
-
-        # Collect unmatched
-        for row in outgoing_candidates:
-            if id(row) not in matched_outgoing:
-                unmatched.append(row)
-        for row in incoming_candidates:
-            if id(row) not in matched_incoming:
-                unmatched.append(row)
+            heads = [
+                queue[0]
+                for account, queue in incoming_by_account.items()
+                if queue and account != out_row.account_value
+            ]
+            if not heads:
+                unmatched.append(out_row)
+                continue
+            _, in_row = min(heads, key=itemgetter(0))
+            incoming_by_account[in_row.account_value].popleft()
+            transfer_pairs.append((out_row, in_row))
+
+        # Collect unmatched incoming rows in their original order
+        unmatched.extend(
+            row
+            for _, row in sorted(
+                chain.from_iterable(incoming_by_account.values()), key=itemgetter(0)
+            )
+        )
 
     # Add warnings for unmatched transfer rows
     for row in unmatched:
@@ -376,16 +512,19 @@ def generate_preview(
     Generate a preview of the import showing resolved values and validation status.
     """
     # Get category and account details for name resolution
-    all_categories = {c.id: c for c in category_crud.get_categories(db, user_id)}
+    categories = category_crud.get_categories(db, user_id)
+    all_categories = {c.id: c for c in categories}
     all_accounts = {a.id: a for a in account_crud.get_accounts(db, user_id)}
 
     # Get transfer category IDs (if they exist)
-    transfer_cat_ids = get_transfer_category_ids(db, user_id)
+    transfer_cat_ids = get_transfer_category_ids(categories)
 
     preview_rows: list[PreviewRow] = []
     warnings: list[str] = []
+    total_valid = 0
 
-    # First pass: create preview rows with resolved values
+    # First pass: create preview rows with resolved values, counting valid
+    # rows as they are built instead of re-scanning the list afterwards
     for row in parsed_rows:
         validation_errors = []
 
@@ -424,12 +563,10 @@ def generate_preview(
             validation_errors.append(f"No mapping for account: {row.account_value}")
 
         # Determine type
-        is_transfer = False
         if transfer_cat_ids and category_id in (
             transfer_cat_ids["incoming"],
             transfer_cat_ids["outgoing"],
         ):
-            is_transfer = True
             tx_type = "transfer"
         elif row.amount < 0:
             tx_type = "expense"
@@ -441,6 +578,7 @@ def generate_preview(
             validation_errors.append("Amount is zero")
 
         is_valid = len(validation_errors) == 0
+        total_valid += is_valid
 
         preview_rows.append(
             PreviewRow(
@@ -459,7 +597,6 @@ def generate_preview(
                 account_name=account_name,
                 is_valid=is_valid,
                 validation_errors=validation_errors,
-                is_transfer=is_transfer,
                 transfer_pair_index=None,  # Will be set in second pass
             )
         )
@@ -485,15 +622,11 @@ def generate_preview(
                 preview_rows[out_idx].transfer_pair_index = in_row.row_index
                 preview_rows[in_idx].transfer_pair_index = out_row.row_index
 
-    # Count valid/invalid
-    total_valid = sum(1 for pr in preview_rows if pr.is_valid)
-    total_invalid = sum(1 for pr in preview_rows if not pr.is_valid)
-
     return PreviewResult(
         profile_id=profile_id,
         rows=preview_rows,
         total_valid=total_valid,
-        total_invalid=total_invalid,
+        total_invalid=len(preview_rows) - total_valid,
         total_transfers=total_transfers,
         warnings=warnings,
     )
@@ -545,15 +678,15 @@ def execute_import(
         )
 
     # Build complete mapping lookups
-    all_category_mappings = import_crud.get_value_mappings_dict(
-        db, profile_id, "category"
-    )
-    all_account_mappings = import_crud.get_value_mappings_dict(
-        db, profile_id, "account"
-    )
+    all_mappings = import_crud.get_value_mappings_by_type(db, profile_id)
+    all_category_mappings = all_mappings["category"]
+    all_account_mappings = all_mappings["account"]
+
+    # Load the user's categories once: for transfer detection and validation
+    categories = category_crud.get_categories(db, user_id)
 
     # Check for transfer categories and detect pairs
-    transfer_cat_ids = get_transfer_category_ids(db, user_id)
+    transfer_cat_ids = get_transfer_category_ids(categories)
     transfer_pairs = []
     regular_rows = rows_to_import
 
@@ -564,7 +697,7 @@ def execute_import(
         errors.extend(pair_warnings)
 
     # Get valid category and account IDs for this user (for validation)
-    valid_category_ids = {c.id for c in category_crud.get_categories(db, user_id)}
+    valid_category_ids = {c.id for c in categories}
     valid_account_ids = {a.id for a in account_crud.get_accounts(db, user_id)}
 
     # Process transfer pairs first
@@ -630,7 +763,8 @@ def execute_import(
             )
             skipped_count += 2
 
-    # Process regular rows
+    # Process regular rows; valid ones are collected and inserted together
+    pending: list[tuple[ParsedRow, TransactionCreate]] = []
     for row in regular_rows:
         # Skip if already processed as part of a transfer
         if row.row_index in processed_transfer_rows:
@@ -699,15 +833,29 @@ def execute_import(
                 description=row.description or f"Imported: {row.external_id}",
                 tags=[],
             )
-
-            transaction_crud.create_transaction(db, tx_data, user_id)
-            imported_count += 1
+            pending.append((row, tx_data))
 
         except Exception as e:
-            db.rollback()  # Rollback the failed transaction to allow subsequent operations
             errors.append(f"Row {row.row_index + 1}: {str(e)}")
             skipped_count += 1
 
+    if pending:
+        try:
+            imported_count += transaction_crud.create_transactions_bulk(
+                db, [tx_data for _, tx_data in pending], user_id
+            )
+        except Exception:
+            db.rollback()
+            # Retry row by row so a database error is reported against its row
+            for row, tx_data in pending:
+                try:
+                    transaction_crud.create_transaction(db, tx_data, user_id)
+                    imported_count += 1
+                except Exception as e:
+                    db.rollback()
+                    errors.append(f"Row {row.row_index + 1}: {str(e)}")
+                    skipped_count += 1
+
     return ImportResult(
         imported_count=imported_count,
         skipped_count=skipped_count,
@@ -101,7 +101,8 @@ export function ImportPreviewTable({
   const invalidCount = rows.filter((r) => !r.isValid).length;
   const excludedCount = excludedIndices.size;
   const transferCount =
-    rows.filter((r) => r.isTransfer && r.transferPairIndex !== null).length / 2;
+    rows.filter((r) => r.type === "transfer" && r.transferPairIndex !== null)
+      .length / 2;
 
   // Count fixable issues (rows with stale mappings that can be fixed inline)
   const fixableCount = rows.filter((r) => {
@@ -147,7 +148,7 @@ export function ImportPreviewTable({
 
   // Get type icon
   const getTypeIcon = (row: PreviewRow) => {
-    if (row.isTransfer) {
+    if (row.type === "transfer") {
       if (row.amount < 0) {
         return <ArrowUpRight className="h-4 w-4 text-orange-500" />;
       }
@@ -161,7 +162,7 @@ export function ImportPreviewTable({
 
   // Get type label
   const getTypeLabel = (row: PreviewRow) => {
-    if (row.isTransfer) {
+    if (row.type === "transfer") {
       return row.amount < 0 ? "Out Transfer" : "In Transfer";
     }
     return row.type === "expense" ? "Expense" : "Income";
@@ -203,7 +204,7 @@ export function ImportPreviewTable({
       );
     }
 
-    if (row.isTransfer && row.transferPairIndex !== null) {
+    if (row.type === "transfer" && row.transferPairIndex !== null) {
       return (
         <Badge className="gap-1 bg-blue-500 hover:bg-blue-600">
           <Link2 className="h-3 w-3" />
@@ -430,7 +431,7 @@ export function ImportPreviewTable({
                     className={cn(
                       isExcluded && "opacity-50 bg-muted/50",
                       hasError && !isExcluded && "bg-red-50/50",
-                      row.isTransfer &&
+                      row.type === "transfer" &&
                         row.transferPairIndex !== null &&
                         "bg-blue-50/30"
                     )}
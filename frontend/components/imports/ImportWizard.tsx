@@ -142,7 +142,8 @@ export function ImportWizard({ onComplete }: ImportWizardProps) {
           result.profileId,
           result.parsedRows,
           catMappingItems,
-          accMappingItems
+          accMappingItems,
+          result.rowsSignature
         );
 
         setPreviewResult(preview);
@@ -196,7 +197,8 @@ export function ImportWizard({ onComplete }: ImportWizardProps) {
         parseResult.profileId,
         parseResult.parsedRows,
         catMappingItems,
-        accMappingItems
+        accMappingItems,
+        parseResult.rowsSignature
       );
 
       setPreviewResult(preview);
@@ -240,7 +242,8 @@ export function ImportWizard({ onComplete }: ImportWizardProps) {
         newCategoryMappings,
         newAccountMappings,
         parseResult.parsedRows,
-        Array.from(excludedIndices)
+        Array.from(excludedIndices),
+        parseResult.rowsSignature
       );
 
       setImportResult(importRes);
@@ -320,7 +323,8 @@ export function ImportWizard({ onComplete }: ImportWizardProps) {
           parseResult.profileId,
           parseResult.parsedRows,
           catMappingItems,
-          accMappingItems
+          accMappingItems,
+          parseResult.rowsSignature
         );
 
         setPreviewResult(preview);
@@ -512,7 +512,8 @@ export function useApi() {
       profileId: string,
       parsedRows: ParsedRow[],
       categoryMappings: MappingItem[],
-      accountMappings: MappingItem[]
+      accountMappings: MappingItem[],
+      rowsSignature?: string | null
     ): Promise<PreviewResult> => {
       const payload = {
         profile_id: profileId,
@@ -533,6 +534,7 @@ export function useApi() {
           csv_value: m.csvValue,
           internal_id: m.internalId,
         })),
+        rows_signature: rowsSignature ?? null,
       };
 
       return apiRequest<PreviewResult>("/api/imports/preview", {
@@ -549,7 +551,8 @@ export function useApi() {
       categoryMappings: MappingItem[],
       accountMappings: MappingItem[],
       parsedRows: ParsedRow[],
-      excludedIndices: number[] = []
+      excludedIndices: number[] = [],
+      rowsSignature?: string | null
     ): Promise<ImportResult> => {
       const payload = {
         profile_id: profileId,
@@ -571,6 +574,8 @@ export function useApi() {
           description: r.description,
         })),
         excluded_indices: excludedIndices,
+        // Lets the server skip re-validating rows it produced itself
+        rows_signature: rowsSignature ?? null,
       };
 
       return apiRequest<ImportResult>("/api/imports/confirm", {
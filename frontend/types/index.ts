@@ -115,6 +115,7 @@ export interface ParseResult {
   unmappedAccounts: string[];
   existingCategoryMappings: Record<string, string>;
   existingAccountMappings: Record<string, string>;
+  rowsSignature?: string | null;
 }
 
 export interface MappingItem {
@@ -153,7 +154,6 @@ export interface PreviewRow {
   isValid: boolean;
   validationErrors: string[];
 
-  isTransfer: boolean;
   transferPairIndex: number | null;
 }
 